@@ -3,15 +3,17 @@
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt
 
+from src.api.utils.response_cache import cached_etag_response
 from src.container import Container
 from src.core.domain.category import Category, CategoryIn
 from src.infrastructure.dto.categorydto import CategoryDTO
 from src.infrastructure.services.icategory import ICategoryService
 from src.infrastructure.utils import consts
+from src.infrastructure.utils.cache import TTLCache
 
 bearer_scheme = HTTPBearer()
 router = APIRouter(tags=["Category"])
@@ -54,19 +56,27 @@ async def create_category(
 @router.get("/all", response_model=Iterable[CategoryDTO], status_code=200)
 @inject
 async def get_all_categories(
+    request: Request,
     service: ICategoryService = Depends(Provide[Container.category_service]),
-) -> Iterable:
+    cache: TTLCache = Depends(Provide[Container.cache]),
+) -> Response:
     """An endpoint for getting all categories.
 
     Args:
+        request (Request): The incoming request.
         service (ICategoryService, optional): The injected service dependency.
+        cache (TTLCache, optional): The injected shared cache.
 
     Returns:
-        Iterable: The category attributes collection.
+        Response: The JSON list of category DTOs, 304 if not modified.
     """
-
-    categories = await service.get_all_categories()
-    return categories
+    return await cached_etag_response(  # type: ignore
+        request,
+        cache,
+        consts.ALL_CATEGORIES_RESPONSE_KEY,
+        service.get_all_categories,
+        ttl=consts.RESPONSE_CACHE_TTL,
+    )
 
 
 @router.get("/{category_id}", response_model=CategoryDTO, status_code=200)
@@ -3,15 +3,22 @@
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt
 
+from src.api.utils.response_cache import cached_etag_response, cached_json_response
 from src.container import Container
-from src.core.domain.equipment import Equipment, EquipmentBroker, EquipmentIn
+from src.core.domain.equipment import (
+    Equipment,
+    EquipmentBroker,
+    EquipmentDetails,
+    EquipmentIn,
+)
 from src.infrastructure.dto.equipmentdto import EquipmentDTO
 from src.infrastructure.services.iequipment import IEquipmentService
 from src.infrastructure.utils import consts
+from src.infrastructure.utils.cache import TTLCache
 
 router = APIRouter(tags=["Equipment"])
 bearer_scheme = HTTPBearer()
@@ -61,27 +68,72 @@ async def create_equipment(
 @inject
 async def get_all_equipment(
     service: IEquipmentService = Depends(Provide[Container.equipment_service]),
-) -> Iterable[dict]:
+    cache: TTLCache = Depends(Provide[Container.cache]),
+) -> Response:
     """An endpoint for getting all equipment.
 
     Args:
         service (IEquipmentService, optional): The injected equipment dependency.
+        cache (TTLCache, optional): The injected shared cache.
 
     Returns:
-        Iterable[dict]: The list of equipment DTOs.
+        Response: The JSON list of equipment DTOs.
     """
-    equipment_list = await service.get_all_equipments()
-    return equipment_list
+    return await cached_json_response(
+        cache,
+        consts.ALL_EQUIPMENT_RESPONSE_KEY,
+        service.get_all_equipments_raw,
+        ttl=consts.RESPONSE_CACHE_TTL,
+    )
 
 
 @router.get("/{equipment_id}", response_model=Equipment, status_code=200)
 @inject
 async def get_equipment_by_id(
     equipment_id: int,
+    request: Request,
     service: IEquipmentService = Depends(Provide[Container.equipment_service]),
-) -> dict:
+    cache: TTLCache = Depends(Provide[Container.cache]),
+) -> Response:
     """An endpoint for getting equipment by id.
 
+    Args:
+        equipment_id (int): The equipment id.
+        request (Request): The incoming request.
+        service (IEquipmentService, optional): The injected equipment dependency.
+        cache (TTLCache, optional): The injected shared cache.
+
+    Raises:
+        HTTPException: 404 if equipment does not exist.
+
+    Returns:
+        Response: The equipment DTO, 304 if not modified.
+    """
+    if response := await cached_etag_response(
+        request,
+        cache,
+        f"{consts.EQUIPMENT_RESPONSE_KEY_PREFIX}{equipment_id}",
+        lambda: service.get_equipment_by_id(equipment_id),
+        ttl=consts.RESPONSE_CACHE_TTL,
+    ):
+        return response
+
+    raise HTTPException(
+        status_code=404,
+        detail="Equipment not found",
+    )
+
+
+@router.get(
+    "/{equipment_id}/details", response_model=EquipmentDetails, status_code=200
+)
+@inject
+async def get_equipment_details(
+    equipment_id: int,
+    service: IEquipmentService = Depends(Provide[Container.equipment_service]),
+) -> dict:
+    """An endpoint for getting equipment with its reviews and average rating.
+
     Args:
         equipment_id (int): The equipment id.
         service (IEquipmentService, optional): The injected equipment dependency.
@@ -90,10 +142,10 @@ async def get_equipment_by_id(
         HTTPException: 404 if equipment does not exist.
 
     Returns:
-        dict: The equipment DTO.
+        dict: The equipment details.
     """
-    if equipment := await service.get_equipment_by_id(equipment_id):
-        return equipment
+    if equipment_details := await service.get_equipment_details(equipment_id):
+        return equipment_details
 
     raise HTTPException(
         status_code=404,
@@ -3,11 +3,12 @@
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt
 from pydantic import UUID4
 
+from src.api.utils.response_cache import cached_json_array_response
 from src.container import Container
 from src.core.domain.equipment_review import (
     EquipmentReview,
@@ -17,6 +18,7 @@ from src.core.domain.equipment_review import (
 from src.infrastructure.dto.equipment_reviewdto import EquipmentReviewDTO
 from src.infrastructure.services.iequipment_review import IEquipmentReviewService
 from src.infrastructure.utils import consts
+from src.infrastructure.utils.cache import TTLCache
 
 bearer_scheme = HTTPBearer()
 router = APIRouter(tags=["Equipment Review"])
@@ -72,17 +74,75 @@ async def get_all_equipment_reviews(
     service: IEquipmentReviewService = Depends(
         Provide[Container.equipment_review_service]
     ),
-) -> Iterable[dict]:
-    """An endpoint for getting all equipment reviews.
+    cache: TTLCache = Depends(Provide[Container.cache]),
+) -> Response:
+    """An endpoint for streaming all equipment reviews.
 
     Args:
         service (IEquipmentReviewService, optional): The injected equipment review dependency.
+        cache (TTLCache, optional): The injected shared cache.
 
     Returns:
-        Iterable[dict]: The list of equipment review DTOs.
+        Response: The JSON array of equipment review DTOs.
+    """
+    return await cached_json_array_response(
+        cache,
+        consts.ALL_EQUIPMENT_REVIEWS_RESPONSE_KEY,
+        service.get_all_equipment_reviews_raw,
+        ttl=consts.RESPONSE_CACHE_TTL,
+    )
+
+
+@router.get(
+    "/equipment",
+    response_model=dict[int, list[EquipmentReview]],
+    status_code=200,
+)
+@inject
+async def get_reviews_by_equipment_ids(
+    equipment_ids: list[int] = Query(max_length=consts.EQUIPMENT_MAX_BATCH_IDS),
+    service: IEquipmentReviewService = Depends(
+        Provide[Container.equipment_review_service]
+    ),
+) -> dict:
+    """An endpoint for getting reviews of many equipments at once.
+
+    At most `EQUIPMENT_MAX_BATCH_IDS` ids are accepted per request.
+
+    Args:
+        equipment_ids (list[int]): The equipment ids.
+        service (IEquipmentReviewService, optional): The injected equipment review dependency.
+
+    Returns:
+        dict: The equipment review DTOs grouped by equipment id.
+    """
+    return await service.get_reviews_by_equipment_ids(equipment_ids)
+
+
+@router.get("/average", response_model=dict[int, float], status_code=200)
+@inject
+async def get_average_ratings_for_equipments(
+    equipment_ids: list[int] = Query(max_length=consts.EQUIPMENT_MAX_BATCH_IDS),
+    service: IEquipmentReviewService = Depends(
+        Provide[Container.equipment_review_service]
+    ),
+) -> dict:
+    """An endpoint for getting average ratings of many equipments at once.
+
+    At most `EQUIPMENT_MAX_BATCH_IDS` ids are accepted per request, so one
+    request cannot evict the hot entries of the shared cache.
+
+    Args:
+        equipment_ids (list[int]): The equipment ids.
+        service (IEquipmentReviewService, optional): The injected equipment review dependency.
+
+    Returns:
+        dict: The average ratings by equipment id.
     """
-    review_list = await service.get_all_equipment_reviews()
-    return review_list
+    ratings = await service.get_average_ratings_for_equipments(equipment_ids)
+    return {
+        equipment_id: rating or 0.0 for equipment_id, rating in ratings.items()
+    }
 
 
 @router.get("/{equipment_review_id}", response_model=EquipmentReview, status_code=200)
@@ -151,7 +211,6 @@ async def delete_equipment_review(
         if str(review_data.reviewer_id) != user_uuid:
             raise HTTPException(status_code=403, detail="Unauthorized")
 
-    if await service.get_equipment_review_by_id(equipment_review_id):
         await service.delete_equipment_review(equipment_review_id)
         return
 
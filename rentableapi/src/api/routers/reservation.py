@@ -1,18 +1,27 @@
 """A module containing reservation-related routers."""
 
+import asyncio
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt
 from pydantic import UUID4
 
+from src.api.utils.response_cache import cached_json_array_response
 from src.container import Container
-from src.core.domain.reservation import Reservation, ReservationBroker, ReservationIn
+from src.core.domain.reservation import (
+    MostRentedEquipment,
+    Reservation,
+    ReservationBroker,
+    ReservationDashboard,
+    ReservationIn,
+)
 from src.infrastructure.services.iequipment import IEquipmentService
 from src.infrastructure.services.ireservation import IReservationService
 from src.infrastructure.utils import consts
+from src.infrastructure.utils.cache import TTLCache
 
 router = APIRouter(tags=["Reservation"])
 bearer_scheme = HTTPBearer()
@@ -66,17 +75,23 @@ async def create_reservation(
 @inject
 async def get_all_reservations(
     service: IReservationService = Depends(Provide[Container.reservation_service]),
-) -> Iterable[dict]:
-    """An endpoint for getting all reservations.
+    cache: TTLCache = Depends(Provide[Container.cache]),
+) -> Response:
+    """An endpoint for streaming all reservations.
 
     Args:
         service (IReservationService, optional): The injected reservation service.
+        cache (TTLCache, optional): The injected shared cache.
 
     Returns:
-        Iterable[dict]: The list of reservation DTOs.
+        Response: The JSON array of reservation DTOs.
     """
-    reservation_list = await service.get_all_reservations()
-    return reservation_list
+    return await cached_json_array_response(
+        cache,
+        consts.ALL_RESERVATIONS_RESPONSE_KEY,
+        service.get_all_reservations_raw,
+        ttl=consts.RESPONSE_CACHE_TTL,
+    )
 
 
 @router.get("/{reservation_id}", response_model=Reservation, status_code=200)
@@ -145,8 +160,13 @@ async def update_reservation(
     ):
         is_owner = str(reservation_data.user_id) == user_uuid
 
-        equipment = await equipment_service.get_equipment_by_id(
-            reservation_data.equipment_id
+        equipment, total_price = await asyncio.gather(
+            equipment_service.get_equipment_by_id(reservation_data.equipment_id),
+            service.calculate_total_price(
+                equipment_id=reservation.equipment_id,
+                start_date=reservation.start_date,
+                end_date=reservation.end_date,
+            ),
         )
         is_equipment_owner = False
         if equipment:
@@ -155,12 +175,6 @@ async def update_reservation(
         if not (is_owner or is_equipment_owner):
             raise HTTPException(status_code=403, detail="Unauthorized")
 
-        total_price = await service.calculate_total_price(
-            equipment_id=reservation.equipment_id,
-            start_date=reservation.start_date,
-            end_date=reservation.end_date,
-        )
-
         extended_updated_reservation = ReservationBroker(
             user_id=user_uuid,
             total_price=total_price,
@@ -214,7 +228,6 @@ async def delete_reservation(
         if str(reservation_data.user_id) != user_uuid:
             raise HTTPException(status_code=403, detail="Unauthorized")
 
-    if await service.get_reservation_by_id(reservation_id):
         await service.delete_reservation(reservation_id)
         return
 
@@ -310,12 +323,14 @@ async def get_all_reservations_by_equipment_id(
     return reservation_list
 
 
-@router.get("/most_rented/{limit}", response_model=Iterable[dict], status_code=200)
+@router.get(
+    "/most_rented/{limit}", response_model=MostRentedEquipment, status_code=200
+)
 @inject
 async def get_most_rented_equipment_ids(
     limit: int,
     service: IReservationService = Depends(Provide[Container.reservation_service]),
-) -> Iterable[dict]:
+) -> dict:
     """An endpoint for getting most rented equipment IDs.
 
     Args:
@@ -323,6 +338,30 @@ async def get_most_rented_equipment_ids(
         service (IReservationService, optional): The injected reservation service.
 
     Returns:
-        Iterable[dict]: The list of most rented equipment IDs.
+        dict: The most rented equipment IDs with their rent counts.
+    """
+    ids, counts = await service.get_most_rented_equipment_ids(limit)
+    return {"ids": ids, "counts": counts}
+
+
+@router.get(
+    "/dashboard/{user_id}", response_model=ReservationDashboard, status_code=200
+)
+@inject
+async def get_user_dashboard(
+    user_id: UUID4,
+    limit: int = 5,
+    service: IReservationService = Depends(Provide[Container.reservation_service]),
+) -> ReservationDashboard:
+    """An endpoint for getting user's reservations with most rented equipment.
+
+    Args:
+        user_id (UUID4): The user UUID4.
+        limit (int, optional): The limit of the most rented equipment IDs.
+            Defaults to 5.
+        service (IReservationService, optional): The injected reservation service.
+
+    Returns:
+        ReservationDashboard: The user's reservations and most rented equipment.
     """
-    return await service.get_most_rented_equipment_ids(limit)
+    return await service.get_user_dashboard(user_id, limit)
@@ -3,15 +3,18 @@
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt
 
+from src.api.utils.response_cache import cached_etag_response
+from src.api.utils.serialization import json_response
 from src.container import Container
 from src.core.domain.subcategory import Subcategory, SubcategoryIn
 from src.infrastructure.dto.subcategorydto import SubcategoryDTO
 from src.infrastructure.services.isubcategory import ISubcategoryService
 from src.infrastructure.utils import consts
+from src.infrastructure.utils.cache import TTLCache
 
 bearer_scheme = HTTPBearer()
 router = APIRouter(tags=["Subcategory"])
@@ -53,19 +56,27 @@ async def create_subcategory(
 @router.get("/all", response_model=Iterable[SubcategoryDTO], status_code=200)
 @inject
 async def get_all_subcategories(
+    request: Request,
     service: ISubcategoryService = Depends(Provide[Container.subcategory_service]),
-) -> Iterable:
+    cache: TTLCache = Depends(Provide[Container.cache]),
+) -> Response:
     """An endpoint for getting all subcategories.
 
     Args:
+        request (Request): The incoming request.
         service (ISubcategoryService, optional): The injected service dependency.
+        cache (TTLCache, optional): The injected shared cache.
 
     Returns:
-        Iterable: The subcategory attributes collection.
+        Response: The JSON list of subcategory DTOs, 304 if not modified.
     """
-
-    subcategories = await service.get_all_subcategories()
-    return subcategories
+    return await cached_etag_response(  # type: ignore
+        request,
+        cache,
+        consts.ALL_SUBCATEGORIES_RESPONSE_KEY,
+        service.get_all_subcategories,
+        ttl=consts.RESPONSE_CACHE_TTL,
+    )
 
 
 @router.get(
@@ -75,7 +86,7 @@ async def get_all_subcategories(
 async def get_all_subcategories_by_category_id(
     category_id: int,
     service: ISubcategoryService = Depends(Provide[Container.subcategory_service]),
-) -> Iterable:
+) -> Response:
     """An endpoint for getting all subcategories by category id.
 
     Args:
@@ -83,34 +94,42 @@ async def get_all_subcategories_by_category_id(
         service (ISubcategoryService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The subcategory attributes collection.
+        Response: The JSON list of subcategory attributes.
     """
-
     subcategories = await service.get_all_subcategories_by_category_id(category_id)
-    return subcategories
+    return json_response(subcategories)
 
 
 @router.get("/{subcategory_id}", response_model=SubcategoryDTO, status_code=200)
 @inject
 async def get_subcategory_by_id(
     subcategory_id: int,
+    request: Request,
     service: ISubcategoryService = Depends(Provide[Container.subcategory_service]),
-) -> dict | None:
+    cache: TTLCache = Depends(Provide[Container.cache]),
+) -> Response:
     """An endpoint for getting subcategory by id.
 
     Args:
         subcategory_id (int): The id of the subcategory.
+        request (Request): The incoming request.
         service (ISubcategoryService, optional): The injected service dependency.
+        cache (TTLCache, optional): The injected shared cache.
 
     Raises:
         HTTPException: 404 if subcategory does not exist.
 
     Returns:
-        dict | None: The subcategory details.
+        Response: The subcategory details, 304 if not modified.
     """
-
-    if subcategory := await service.get_subcategory_by_id(subcategory_id):
-        return subcategory.model_dump()
+    if response := await cached_etag_response(
+        request,
+        cache,
+        f"{consts.SUBCATEGORY_RESPONSE_KEY_PREFIX}{subcategory_id}",
+        lambda: service.get_subcategory_by_id(subcategory_id),
+        ttl=consts.RESPONSE_CACHE_TTL,
+    ):
+        return response
 
     raise HTTPException(status_code=404, detail="Subcategory not found")
 
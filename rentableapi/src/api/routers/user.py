@@ -4,8 +4,10 @@ from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
 
+from src.api.utils.streaming import stream_json_array
 from src.container import Container
 from src.core.domain.user import UserIn
 from src.infrastructure.dto.tokendto import TokenDTO
@@ -70,17 +72,17 @@ async def authenticate_user(
 @inject
 async def get_all_users(
     service: IUserService = Depends(Provide[Container.user_service]),
-) -> Iterable[dict]:
-    """An endpoint for getting all users.
+) -> StreamingResponse:
+    """An endpoint for streaming all users.
 
     Args:
         service (IUserService, optional): The injected user service.
 
     Returns:
-        Iterable[dict]: The list of user DTOs.
+        StreamingResponse: The JSON array of user DTOs.
     """
-    users = await service.get_all_users()
-    return [UserDTO(**dict(user)).model_dump() for user in users]
+    users = (UserDTO.model_validate(user) async for user in service.get_all_users())
+    return StreamingResponse(stream_json_array(users), media_type="application/json")
 
 
 @router.get("/{user_id}", response_model=UserDTO, status_code=200)
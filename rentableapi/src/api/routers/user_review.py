@@ -3,11 +3,14 @@
 from typing import Iterable, Optional
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt
 from pydantic import UUID4
 
+from src.api.utils.serialization import json_response
+from src.api.utils.streaming import stream_json_array
 from src.container import Container
 from src.core.domain.user_review import UserReview, UserReviewIn, UserReviewBroker
 from src.infrastructure.services.iuser_review import IUserReviewService
@@ -57,20 +60,67 @@ async def create_user_review(
         return new_user_review.model_dump()
 
 
+@router.post("/create/bulk", response_model=Iterable[UserReview], status_code=201)
+@inject
+async def create_user_reviews_bulk(
+    reviews: list[UserReviewIn] = Body(
+        ..., max_length=consts.USER_REVIEWS_MAX_BULK_SIZE
+    ),
+    service: IUserReviewService = Depends(Provide[Container.user_review_service]),
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> Iterable[UserReview]:
+    """An endpoint for adding many user reviews with a single insert.
+
+    The request may carry at most `USER_REVIEWS_MAX_BULK_SIZE` reviews so
+    the insert stays within the bind parameter limit of the database.
+
+    Args:
+        reviews (list[UserReviewIn]): The user reviews input data.
+        service (IUserReviewService, optional): The injected user review dependency.
+        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+
+    Raises:
+        HTTPException: 403 if unauthorized.
+
+    Returns:
+        Iterable[UserReview]: The created user reviews.
+    """
+    token = credentials.credentials
+    token_payload = jwt.decode(
+        token,
+        key=consts.SECRET_KEY,
+        algorithms=[consts.ALGORITHM],
+    )
+    user_uuid = token_payload.get("sub")
+
+    if not user_uuid:
+        raise HTTPException(status_code=403, detail="Unauthorized")
+
+    return await service.add_user_reviews_bulk(
+        [
+            UserReviewBroker(reviewer_id=user_uuid, **review.model_dump())
+            for review in reviews
+        ]
+    )
+
+
 @router.get("/all", response_model=Iterable[UserReview], status_code=200)
 @inject
 async def get_all_user_reviews(
     service: IUserReviewService = Depends(Provide[Container.user_review_service]),
-) -> Iterable[UserReview]:
-    """An endpoint for getting all user reviews.
+) -> StreamingResponse:
+    """An endpoint for streaming all user reviews.
 
     Args:
         service (IUserReviewService, optional): The injected user review dependency.
 
     Returns:
-        Iterable[UserReview]: The list of user review DTOs.
+        StreamingResponse: The JSON array of user review DTOs.
     """
-    return await service.get_all_user_reviews()
+    return StreamingResponse(
+        stream_json_array(service.get_all_user_reviews()),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -80,7 +130,7 @@ async def get_all_user_reviews(
 async def get_sent_reviews_for_user_id(
     user_id: UUID4,
     service: IUserReviewService = Depends(Provide[Container.user_review_service]),
-) -> Iterable[UserReview]:
+) -> Response:
     """An endpoint for getting all reviews sent by a user.
 
     Args:
@@ -88,10 +138,10 @@ async def get_sent_reviews_for_user_id(
         service (IUserReviewService, optional): The injected user review dependency.
 
     Returns:
-        Iterable[UserReview]: The list of user review DTOs.
+        Response: The JSON list of user review DTOs.
     """
     reviews = await service.get_sent_reviews_for_user_id(user_id)
-    return reviews
+    return json_response(reviews)
 
 
 @router.get(
@@ -100,19 +150,33 @@ async def get_sent_reviews_for_user_id(
 @inject
 async def get_received_reviews_for_user_id(
     user_id: UUID4,
+    before: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=consts.USER_REVIEWS_MAX_PAGE_SIZE),
     service: IUserReviewService = Depends(Provide[Container.user_review_service]),
-) -> Iterable[UserReview]:
-    """An endpoint for getting all reviews received by user.
+) -> Response:
+    """An endpoint for getting reviews received by user.
+
+    Without `before` and `limit` all reviews are returned. Otherwise the
+    reviews are paged newest first; the next page starts before the id
+    of the last review of the current one.
 
     Args:
         user_id (UUID4): The user id.
+        before (Optional[int], optional): The id of the last review of the
+            previous page. Defaults to None.
+        limit (Optional[int], optional): The size of the page. Defaults to None.
         service (IUserReviewService, optional): The injected user review dependency.
 
     Returns:
-        Iterable[UserReview]: The list of user review DTOs.
+        Response: The JSON list of user review DTOs.
     """
-    reviews = await service.get_received_reviews_for_user_id(user_id)
-    return reviews
+    if before is None and limit is None:
+        reviews = await service.get_received_reviews_for_user_id(user_id)
+    else:
+        reviews = await service.get_received_reviews_page(
+            user_id, before, limit or consts.USER_REVIEWS_PAGE_SIZE
+        )
+    return json_response(reviews)
 
 
 @router.get("/average/{user_id}", response_model=Optional[float], status_code=200)
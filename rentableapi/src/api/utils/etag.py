@@ -0,0 +1,104 @@
+"""A module containing entity tag helpers for conditional GET requests."""
+
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def compute_etag(body: bytes, weak: bool = False) -> str:
+    """A function computing the entity tag of a response body.
+
+    Args:
+        body (bytes): The serialized response body.
+        weak (bool, optional): Whether the tag only marks semantic
+            equivalence. Defaults to False.
+
+    Returns:
+        str: The quoted entity tag.
+    """
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    return f"W/{etag}" if weak else etag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """A function checking the `If-None-Match` header against an entity tag.
+
+    Tags are compared weakly, as required for `If-None-Match`.
+
+    Args:
+        if_none_match (str | None): The value of the header if sent.
+        etag (str): The current entity tag.
+
+    Returns:
+        bool: True if the client already holds the current body.
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    etag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+class ETagMiddleware:
+    """A middleware answering conditional GET requests of buffered responses.
+
+    Successful GET responses sent in a single body message get a weak
+    ETag of their body, and a matching `If-None-Match` turns them into an
+    empty 304. Streamed responses and responses already carrying an ETag
+    are passed through untouched, so streaming is never buffered.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """The method handling a single ASGI request.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel of the request.
+            send (Send): The send channel of the response.
+        """
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message: Message | None = None
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if message["status"] == 200 and "etag" not in headers:
+                    start_message = message
+                    return
+            elif start_message is not None and message["type"] == "http.response.body":
+                pending_start, start_message = start_message, None
+                if not message.get("more_body", False):
+                    body = message.get("body", b"")
+                    etag = compute_etag(body, weak=True)
+                    headers = MutableHeaders(raw=pending_start["headers"])
+                    headers["ETag"] = etag
+                    if etag_matches(if_none_match, etag):
+                        del headers["content-length"]
+                        del headers["content-type"]
+                        pending_start["status"] = 304
+                        message = {"type": "http.response.body", "body": b""}
+
+                await send(pending_start)
+
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
@@ -0,0 +1,169 @@
+"""A module containing helpers serving JSON responses from the shared cache."""
+
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+
+from src.api.utils.etag import compute_etag, etag_matches
+from src.api.utils.serialization import dump_json
+from src.api.utils.streaming import stream_json_array
+from src.infrastructure.utils.cache import TTLCache
+
+_MAX_CACHED_STREAM_SIZE = 1024 * 1024
+
+
+class _NoData(Exception):
+    """An exception raised by a loader finding no data, so nothing is cached."""
+
+
+async def cached_json_response(
+    cache: TTLCache,
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: float,
+) -> Response:
+    """A function serving a JSON response body from the cache.
+
+    On a miss the loader is awaited and its serialized result is cached,
+    so cache hits skip both the database and the serialization.
+
+    Args:
+        cache (TTLCache): The cache holding serialized bodies.
+        key (str): The cache key of the response body.
+        loader (Callable[[], Awaitable[Any]]): The coroutine function
+            loading the response data.
+        ttl (float): The lifetime of the cached body in seconds.
+
+    Returns:
+        Response: The JSON response.
+    """
+    body = await cache.get_or_load(key, lambda: _load_body(loader), ttl=ttl)
+    return Response(content=body, media_type="application/json")
+
+
+async def cached_etag_response(
+    request: Request,
+    cache: TTLCache,
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: float,
+) -> Response | None:
+    """A function serving a cached JSON response validated with an ETag.
+
+    The body is cached together with its hash sent as the `ETag` header.
+    A client presenting a matching `If-None-Match` header gets an empty
+    304 response instead of the body. Concurrent misses share one load,
+    and a missing resource is not cached.
+
+    Args:
+        request (Request): The incoming request.
+        cache (TTLCache): The cache holding tagged bodies.
+        key (str): The cache key of the response body.
+        loader (Callable[[], Awaitable[Any]]): The coroutine function
+            loading the response data.
+        ttl (float): The lifetime of the cached body in seconds.
+
+    Returns:
+        Response | None: The JSON or 304 response, None if the loader
+            found no data.
+    """
+    try:
+        etag, body = await cache.get_or_load(
+            key, lambda: _load_tagged_body(loader), ttl=ttl
+        )
+    except _NoData:
+        return None
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(
+        content=body, media_type="application/json", headers={"ETag": etag}
+    )
+
+
+async def cached_json_array_response(
+    cache: TTLCache,
+    key: str,
+    items: Callable[[], AsyncIterator[Any]],
+    ttl: float,
+) -> Response:
+    """A function serving a streamed JSON array from the cache.
+
+    On a miss the array is streamed to the client while its chunks are
+    collected; the body is cached only if it stays below 1 MiB, so large
+    tables keep being streamed instead of held in memory. A body whose
+    key is invalidated during the stream is not cached.
+
+    Args:
+        cache (TTLCache): The cache holding serialized bodies.
+        key (str): The cache key of the response body.
+        items (Callable[[], AsyncIterator[Any]]): The function
+            returning the streamed models or rows.
+        ttl (float): The lifetime of the cached body in seconds.
+
+    Returns:
+        Response: The JSON response.
+    """
+    if (body := cache.get(key)) is not None:
+        return Response(content=body, media_type="application/json")
+
+    async def stream_and_collect() -> AsyncIterator[bytes]:
+        load = cache.begin_load(key, ttl=ttl)
+        chunks: list[bytes] | None = [] if load is not None else None
+        size = 0
+        is_complete = False
+        try:
+            async for chunk in stream_json_array(items()):
+                if chunks is not None:
+                    size += len(chunk)
+                    if size <= _MAX_CACHED_STREAM_SIZE:
+                        chunks.append(chunk)
+                    else:
+                        chunks = None
+                yield chunk
+            is_complete = True
+        finally:
+            if load is not None:
+                if is_complete and chunks is not None and not load.done():
+                    load.set_result(b"".join(chunks))
+                else:
+                    load.cancel()
+
+    return StreamingResponse(stream_and_collect(), media_type="application/json")
+
+
+async def _load_tagged_body(
+    loader: Callable[[], Awaitable[Any]],
+) -> tuple[str, bytes]:
+    """A function loading and serializing a response body with its ETag.
+
+    Args:
+        loader (Callable[[], Awaitable[Any]]): The coroutine function
+            loading the response data.
+
+    Raises:
+        _NoData: If the loader found no data.
+
+    Returns:
+        tuple[str, bytes]: The ETag and the serialized response data.
+    """
+    if (data := await loader()) is None:
+        raise _NoData
+
+    body = dump_json(data)
+    return compute_etag(body, weak=True), body
+
+
+async def _load_body(loader: Callable[[], Awaitable[Any]]) -> bytes:
+    """A function loading and serializing a response body.
+
+    Args:
+        loader (Callable[[], Awaitable[Any]]): The coroutine function
+            loading the response data.
+
+    Returns:
+        bytes: The serialized response data.
+    """
+    return dump_json(await loader())
@@ -0,0 +1,72 @@
+"""A module containing the JSON serialization of response bodies."""
+
+from typing import Any
+from uuid import UUID
+
+import orjson
+from asyncpg import Record  # type: ignore
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def _to_jsonable(value: Any) -> Any:
+    """A function converting values orjson cannot serialize natively.
+
+    Args:
+        value (Any): The value to be converted.
+
+    Raises:
+        TypeError: If the value is not supported.
+
+    Returns:
+        Any: The serializable representation of the value.
+    """
+    if isinstance(value, Record):
+        return dict(value)
+
+    if isinstance(value, UUID):
+        return str(value)
+
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+
+    raise TypeError(f"Type {type(value).__name__} is not JSON serializable")
+
+
+def dump_json(value: Any) -> bytes:
+    """A function serializing a value into JSON bytes.
+
+    Database rows are serialized directly, so the raw read-only listings
+    skip building and validating a domain model per row.
+
+    Args:
+        value (Any): The value to be serialized.
+
+    Returns:
+        bytes: The serialized value.
+    """
+    return orjson.dumps(
+        value,
+        default=_to_jsonable,
+        option=orjson.OPT_SERIALIZE_UUID | orjson.OPT_NAIVE_UTC,
+    )
+
+
+def json_response(value: Any, status_code: int = 200) -> Response:
+    """A function building a JSON response from already validated data.
+
+    Returning a response skips the revalidation of the data against
+    the `response_model` of the endpoint.
+
+    Args:
+        value (Any): The value to be serialized.
+        status_code (int, optional): The status code. Defaults to 200.
+
+    Returns:
+        Response: The JSON response.
+    """
+    return Response(
+        content=dump_json(value),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -0,0 +1,38 @@
+"""A module containing helpers for streamed JSON responses."""
+
+from typing import Any, AsyncIterator
+
+from pydantic import BaseModel
+
+from src.api.utils.serialization import dump_json
+
+_CHUNK_SIZE = 64 * 1024
+
+
+async def stream_json_array(items: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    """A function serializing models or rows into a JSON array chunk by chunk.
+
+    Rows are serialized as they arrive from the database, so only one
+    chunk of the response is held in memory at a time.
+
+    Args:
+        items (AsyncIterator[Any]): The models or database rows to be serialized.
+
+    Yields:
+        bytes: The consecutive chunks of the JSON array.
+    """
+    buffer = bytearray(b"[")
+    separator = b""
+    async for item in items:
+        buffer += separator
+        if isinstance(item, BaseModel):
+            buffer += item.model_dump_json().encode()
+        else:
+            buffer += dump_json(item)
+        separator = b","
+        if len(buffer) >= _CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+
+    buffer += b"]"
+    yield bytes(buffer)
@@ -15,9 +15,19 @@ class AppConfig(BaseConfig):
     """A class containing app's configuration."""
 
     DB_HOST: Optional[str] = None
+    DB_PORT: int = 5432
+    DB_DIRECT_HOST: Optional[str] = None
+    DB_DIRECT_PORT: int = 5432
     DB_NAME: Optional[str] = None
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
+    DB_POOL_MIN_SIZE: int = 10
+    DB_POOL_MAX_SIZE: int = 50
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = 300.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_COMMAND_TIMEOUT: float = 30.0
+    DB_INIT_ON_STARTUP: bool = True
+    LOG_LEVEL: str = "INFO"
 
 
 config = AppConfig()
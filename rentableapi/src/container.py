@@ -17,10 +17,19 @@ from src.infrastructure.services.reservation import ReservationService
 from src.infrastructure.services.subcategory import SubcategoryService
 from src.infrastructure.services.user_review import UserReviewService
 from src.infrastructure.services.user import UserService
+from src.infrastructure.utils.cache import TTLCache
+from src.infrastructure.utils.cache_invalidation import CacheInvalidationListener
 
 
 class Container(DeclarativeContainer):
-    """Container class for dependency injection purposes."""
+    """Container class for dependency injection purposes.
+
+    Services keeping no per-request state are singletons shared by all
+    requests; the others are created for every request.
+    """
+
+    cache = Singleton(TTLCache)
+    cache_invalidation_listener = Singleton(CacheInvalidationListener, cache=cache)
 
     category_repository = Singleton(CategoryRepository)
     subcategory_repository = Singleton(SubcategoryRepository)
@@ -31,16 +40,26 @@ class Container(DeclarativeContainer):
 
     user_repository = Singleton(UserRepository)
 
-    category_service = Factory(CategoryService, repository=category_repository)
-    subcategory_service = Factory(SubcategoryService, repository=subcategory_repository)
+    category_service = Factory(
+        CategoryService, repository=category_repository, cache=cache
+    )
+    subcategory_service = Singleton(
+        SubcategoryService, repository=subcategory_repository, cache=cache
+    )
     equipment_service = Factory(
         EquipmentService,
         repository=equipment_repository,
         user_repository=user_repository,
+        equipment_review_repository=equipment_review_repository,
+        cache=cache,
+    )
+    equipment_review_service = Singleton(
+        EquipmentReviewService, repository=equipment_review_repository, cache=cache
+    )
+    user_review_service = Singleton(
+        UserReviewService, repository=user_review_repository, cache=cache
     )
-    equipment_review_service = Factory(
-        EquipmentReviewService, repository=equipment_review_repository
+    reservation_service = Singleton(
+        ReservationService, repository=reservation_repository, cache=cache
     )
-    user_review_service = Factory(UserReviewService, repository=user_review_repository)
-    reservation_service = Factory(ReservationService, repository=reservation_repository)
     user_service = Factory(UserService, repository=user_repository)
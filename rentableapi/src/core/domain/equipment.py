@@ -4,6 +4,8 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, UUID4
 
+from src.core.domain.equipment_review import EquipmentReview
+
 
 class EquipmentIn(BaseModel):
     """Model representing equipment's DTO attributes."""
@@ -27,3 +29,10 @@ class Equipment(EquipmentBroker):
     id: int
     category_id: Optional[int]
     model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class EquipmentDetails(Equipment):
+    """Model representing equipment's attributes extended with its reviews."""
+
+    average_rating: Optional[float]
+    reviews: list[EquipmentReview]
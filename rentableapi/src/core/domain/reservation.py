@@ -36,3 +36,17 @@ class Reservation(ReservationBroker):
 
     id: int
     model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class MostRentedEquipment(BaseModel):
+    """Model representing most rented equipment IDs with their rent counts."""
+
+    ids: list[int]
+    counts: list[int]
+
+
+class ReservationDashboard(BaseModel):
+    """Model representing user's reservations with most rented equipment."""
+
+    reservations: list[Reservation]
+    most_rented: MostRentedEquipment
@@ -14,7 +14,10 @@ class SubcategoryIn(BaseModel):
 
 
 class Subcategory(SubcategoryIn):
-    """Model representing subcategory's attributes in the database."""
+    """Model representing subcategory's attributes in the database.
+
+    Instances are frozen, as they are shared through the cache.
+    """
 
     id: int
-    model_config = ConfigDict(from_attributes=True, extra="ignore")
+    model_config = ConfigDict(from_attributes=True, extra="ignore", frozen=True)
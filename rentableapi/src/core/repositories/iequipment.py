@@ -1,7 +1,7 @@
 """Module containing equipment repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Any, Iterable, Mapping
 
 from src.core.domain.equipment import Equipment, EquipmentIn
 
@@ -17,6 +17,14 @@ class IEquipmentRepository(ABC):
             Iterable[Equipment]: The collection of the all equipment.
         """
 
+    @abstractmethod
+    async def get_all_equipments_raw(self) -> Iterable[Mapping[str, Any]]:
+        """The abstract method getting all equipment rows from the data storage.
+
+        Returns:
+            Iterable[Mapping[str, Any]]: The rows of all equipment.
+        """
+
     @abstractmethod
     async def get_equipment_by_id(self, equipment_id: int) -> Equipment | None:
         """The abstract method getting a equipment by provided id from the data storage.
@@ -1,9 +1,8 @@
 """Module containing equipment review repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
-
-from pydantic import UUID4
+from typing import Any, AsyncIterator, Iterable, Mapping
+from uuid import UUID
 
 from src.core.domain.equipment_review import (
     EquipmentReview,
@@ -15,11 +14,19 @@ class IEquipmentReviewRepository(ABC):
     """The abstract class representing protocol of equipment reviews repository."""
 
     @abstractmethod
-    async def get_all_equipment_reviews(self) -> Iterable[EquipmentReview]:
-        """The abstract method getting all equipment reviews from the data storage.
+    def get_all_equipment_reviews(self) -> AsyncIterator[EquipmentReview]:
+        """The abstract method streaming all equipment reviews from the data storage.
+
+        Returns:
+            AsyncIterator[EquipmentReview]: Equipment reviews in the data storage.
+        """
+
+    @abstractmethod
+    def get_all_equipment_reviews_raw(self) -> AsyncIterator[Mapping[str, Any]]:
+        """The abstract method streaming all equipment review rows.
 
         Returns:
-            Iterable[EquipmentReview]: Equipment reviews in the data storage.
+            AsyncIterator[Mapping[str, Any]]: The rows of all equipment reviews.
         """
 
     @abstractmethod
@@ -48,14 +55,27 @@ class IEquipmentReviewRepository(ABC):
             Iterable[EquipmentReview]: The collection of the all equipment reviews for provided equipment.
         """
 
+    @abstractmethod
+    async def get_reviews_by_equipment_ids(
+        self, equipment_ids: list[int]
+    ) -> dict[int, list[EquipmentReview]]:
+        """The abstract method getting equipment reviews for many equipments at once.
+
+        Args:
+            equipment_ids (list[int]): The ids of the equipments.
+
+        Returns:
+            dict[int, list[EquipmentReview]]: The reviews grouped by equipment id.
+        """
+
     @abstractmethod
     async def get_reviews_by_reviewer_id(
-        self, reviewer_id: UUID4
+        self, reviewer_id: UUID
     ) -> Iterable[EquipmentReview] | None:
         """The abstract method getting all equipment reviews by provided reviewer id.
 
         Args:
-            reviewer_id (UUID4): The id of the reviewer.
+            reviewer_id (UUID): The id of the reviewer.
 
         Returns:
             Iterable[EquipmentReview]: The collection of the all equipment reviews from provided reviewer.
@@ -72,6 +92,19 @@ class IEquipmentReviewRepository(ABC):
             float | None: The average rating for the equipment.
         """
 
+    @abstractmethod
+    async def get_average_ratings_for_equipments(
+        self, equipment_ids: list[int]
+    ) -> dict[int, float]:
+        """The abstract method getting average ratings for many equipments at once.
+
+        Args:
+            equipment_ids (list[int]): The ids of the equipments.
+
+        Returns:
+            dict[int, float]: The average ratings of the reviewed equipments.
+        """
+
     @abstractmethod
     async def add_equipment_review(
         self, data: EquipmentReviewIn
@@ -86,12 +119,14 @@ class IEquipmentReviewRepository(ABC):
         """
 
     @abstractmethod
-    async def delete_equipment_review(self, equipment_review_id: int) -> bool:
+    async def delete_equipment_review(
+        self, equipment_review_id: int
+    ) -> EquipmentReview | None:
         """The abstract method remmoving equipment review from the data storage.
 
         Args:
             equipment_review_id (int): The id of the equipment review.
 
         Returns:
-            bool: Success of the operation.
+            EquipmentReview | None: The deleted equipment review if existed.
         """
@@ -2,9 +2,8 @@
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Iterable
-
-from pydantic import UUID4
+from typing import Any, AsyncIterator, Iterable, Mapping
+from uuid import UUID
 
 from src.core.domain.reservation import Reservation, ReservationIn
 
@@ -13,11 +12,19 @@ class IReservationRepository(ABC):
     """The abstract class representing protocol of reservation repository."""
 
     @abstractmethod
-    async def get_all_reservations(self) -> Iterable[Reservation]:
-        """The abstract method getting all reservations from the data storage.
+    def get_all_reservations(self) -> AsyncIterator[Reservation]:
+        """The abstract method streaming all reservations from the data storage.
+
+        Returns:
+            AsyncIterator[Reservation]: The all reservations in the data storage.
+        """
+
+    @abstractmethod
+    def get_all_reservations_raw(self) -> AsyncIterator[Mapping[str, Any]]:
+        """The abstract method streaming all reservation rows from the data storage.
 
         Returns:
-            Iterable[Reservation]: The collection of the all reservations in the data storage.
+            AsyncIterator[Mapping[str, Any]]: The rows of all reservations.
         """
 
     @abstractmethod
@@ -46,12 +53,12 @@ class IReservationRepository(ABC):
 
     @abstractmethod
     async def get_all_reservations_by_user(
-        self, user_id: UUID4
+        self, user_id: UUID
     ) -> Iterable[Reservation]:
         """The abstract method getting all reservations by provided user id from the data storage.
 
         Args:
-            user_id (UUID4): The id of the user.
+            user_id (UUID): The id of the user.
 
         Returns:
             Iterable[Reservation]: The collection of the all reservations from privided user in the data storage.
@@ -83,6 +90,58 @@ class IReservationRepository(ABC):
             Iterable[Reservation]: The collection of the all reservations from provided subcategory in the data storage.
         """
 
+    @abstractmethod
+    async def get_reservations_for_user_ids(
+        self, user_ids: list[UUID]
+    ) -> dict[UUID, list[Reservation]]:
+        """The abstract method getting reservations of many users at once.
+
+        Args:
+            user_ids (list[UUID]): The ids of the users.
+
+        Returns:
+            dict[UUID, list[Reservation]]: The reservations grouped by the id.
+        """
+
+    @abstractmethod
+    async def get_reservations_for_equipment_ids(
+        self, equipment_ids: list[int]
+    ) -> dict[int, list[Reservation]]:
+        """The abstract method getting reservations of many equipments at once.
+
+        Args:
+            equipment_ids (list[int]): The ids of the equipments.
+
+        Returns:
+            dict[int, list[Reservation]]: The reservations grouped by the id.
+        """
+
+    @abstractmethod
+    async def get_reservations_for_category_ids(
+        self, category_ids: list[int]
+    ) -> dict[int, list[Reservation]]:
+        """The abstract method getting reservations of many categories at once.
+
+        Args:
+            category_ids (list[int]): The ids of the categories.
+
+        Returns:
+            dict[int, list[Reservation]]: The reservations grouped by the id.
+        """
+
+    @abstractmethod
+    async def get_reservations_for_subcategory_ids(
+        self, subcategory_ids: list[int]
+    ) -> dict[int, list[Reservation]]:
+        """The abstract method getting reservations of many subcategories at once.
+
+        Args:
+            subcategory_ids (list[int]): The ids of the subcategories.
+
+        Returns:
+            dict[int, list[Reservation]]: The reservations grouped by the id.
+        """
+
     @abstractmethod
     async def add_reservation(self, data: ReservationIn) -> Reservation | None:
         """The abstract method adding new reservation to the data storage.
@@ -94,6 +153,19 @@ class IReservationRepository(ABC):
             Reservation | None: The newly created reservation.
         """
 
+    @abstractmethod
+    async def add_reservations_bulk(
+        self, data: list[ReservationIn]
+    ) -> Iterable[Reservation]:
+        """The abstract method adding many reservations to the data storage at once.
+
+        Args:
+            data (list[ReservationIn]): The details of the new reservations.
+
+        Returns:
+            Iterable[Reservation]: The collection of the newly created reservations.
+        """
+
     @abstractmethod
     async def update_reservation(
         self, reservation_id: int, data: ReservationIn
@@ -120,14 +192,16 @@ class IReservationRepository(ABC):
         """
 
     @abstractmethod
-    async def get_most_rented_equipment_ids(self, limit: int) -> Iterable[dict]:
+    async def get_most_rented_equipment_ids(
+        self, limit: int
+    ) -> tuple[list[int], list[int]]:
         """The abstract method getting most rented equipment IDs from the data storage.
 
         Args:
             limit (int): The number of items to return.
 
         Returns:
-            Iterable[dict]: The collection of the all equipment IDs.
+            tuple[list[int], list[int]]: The equipment IDs and their rent counts.
         """
 
     @abstractmethod
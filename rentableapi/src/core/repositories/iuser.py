@@ -2,11 +2,10 @@
 
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator
+from uuid import UUID
 
-from pydantic import UUID4
-
-from src.core.domain.user import UserIn
+from src.core.domain.user import User, UserIn
 
 
 class IUserRepository(ABC):
@@ -24,11 +23,11 @@ class IUserRepository(ABC):
         """
 
     @abstractmethod
-    async def get_by_uuid(self, uuid: UUID4) -> Any | None:
+    async def get_by_uuid(self, uuid: UUID) -> Any | None:
         """A method getting user by UUID.
 
         Args:
-            uuid (UUID4): UUID of the user.
+            uuid (UUID): UUID of the user.
 
         Returns:
             Any | None: The user object if exists.
@@ -46,9 +45,20 @@ class IUserRepository(ABC):
         """
 
     @abstractmethod
-    async def get_all_users(self) -> Any:
-        """A method getting all users.
+    async def email_exists(self, email: str) -> bool:
+        """A method checking if user with provided email exists.
+
+        Args:
+            email (str): The email of the user.
+
+        Returns:
+            bool: True if the email is already registered, False otherwise.
+        """
+
+    @abstractmethod
+    def get_all_users(self) -> AsyncIterator[User]:
+        """A method streaming all users.
 
         Returns:
-            Any: The list of all users.
+            AsyncIterator[User]: The all users.
         """
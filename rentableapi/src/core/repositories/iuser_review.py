@@ -1,9 +1,8 @@
 """Module containing user review repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
-
-from pydantic import UUID4
+from typing import AsyncIterator, Iterable
+from uuid import UUID
 
 from src.core.domain.user_review import (
     UserReview,
@@ -15,11 +14,11 @@ class IUserReviewRepository(ABC):
     """The abstract class representing protocol of user reviews repository."""
 
     @abstractmethod
-    async def get_all_user_reviews(self) -> Iterable[UserReview]:
-        """The abstract method getting all user reviews from the data storage.
+    def get_all_user_reviews(self) -> AsyncIterator[UserReview]:
+        """The abstract method streaming all user reviews from the data storage.
 
         Returns:
-            Iterable[UserReview]: User reviews in the data storage.
+            AsyncIterator[UserReview]: User reviews in the data storage.
         """
 
     @abstractmethod
@@ -35,12 +34,12 @@ class IUserReviewRepository(ABC):
 
     @abstractmethod
     async def get_sent_reviews_for_user_id(
-        self, user_id: UUID4
+        self, user_id: UUID
     ) -> Iterable[UserReview] | None:
         """The abstract method getting all user reviews sent by provided user id.
 
         Args:
-            user_id (UUID4): The id of the user.
+            user_id (UUID): The id of the user.
 
         Returns:
             Iterable[UserReview]: The collection of the all user reviews sent by provided user.
@@ -48,28 +47,83 @@ class IUserReviewRepository(ABC):
 
     @abstractmethod
     async def get_received_reviews_for_user_id(
-        self, user_id: UUID4
+        self, user_id: UUID
     ) -> Iterable[UserReview] | None:
         """The abstract method getting all user reviews received by provided user id.
 
         Args:
-            user_id (UUID4): The id of the user.
+            user_id (UUID): The id of the user.
 
         Returns:
             Iterable[UserReview]: The collection of the all user reviews received by provided user.
         """
 
     @abstractmethod
-    async def get_average_rating_for_user(self, user_id: UUID4) -> float | None:
+    async def get_received_reviews_page(
+        self, user_id: UUID, before_id: int | None, limit: int
+    ) -> Iterable[UserReview]:
+        """The abstract method getting a page of user reviews received by the user.
+
+        Args:
+            user_id (UUID): The id of the user.
+            before_id (int | None): The id of the last review of the previous
+                page, None for the first page.
+            limit (int): The maximum number of reviews in the page.
+
+        Returns:
+            Iterable[UserReview]: The user reviews, newest first.
+        """
+
+    @abstractmethod
+    async def get_average_rating_for_user(self, user_id: UUID) -> float | None:
         """The abstract method getting average rating for the user by provided user id.
 
         Args:
-            user_id (UUID4): The id of the user.
+            user_id (UUID): The id of the user.
 
         Returns:
             float | None: The average rating for the user.
         """
 
+    @abstractmethod
+    async def get_sent_reviews_for_user_ids(
+        self, user_ids: list[UUID]
+    ) -> dict[UUID, list[UserReview]]:
+        """The abstract method getting user reviews sent by many users at once.
+
+        Args:
+            user_ids (list[UUID]): The ids of the users.
+
+        Returns:
+            dict[UUID, list[UserReview]]: The reviews grouped by the reviewer id.
+        """
+
+    @abstractmethod
+    async def get_received_reviews_for_user_ids(
+        self, user_ids: list[UUID]
+    ) -> dict[UUID, list[UserReview]]:
+        """The abstract method getting user reviews received by many users at once.
+
+        Args:
+            user_ids (list[UUID]): The ids of the users.
+
+        Returns:
+            dict[UUID, list[UserReview]]: The reviews grouped by the reviewed user id.
+        """
+
+    @abstractmethod
+    async def get_average_ratings_for_users(
+        self, user_ids: list[UUID]
+    ) -> dict[UUID, float | None]:
+        """The abstract method getting average ratings of many users at once.
+
+        Args:
+            user_ids (list[UUID]): The ids of the users.
+
+        Returns:
+            dict[UUID, float | None]: The average ratings by the user id.
+        """
+
     @abstractmethod
     async def add_user_review(self, data: UserReviewIn) -> UserReview | None:
         """The abstract method adding new user review to the data storage.
@@ -81,6 +135,19 @@ class IUserReviewRepository(ABC):
             UserReview | None: The newly created user review.
         """
 
+    @abstractmethod
+    async def add_user_reviews_bulk(
+        self, data: list[UserReviewIn]
+    ) -> Iterable[UserReview]:
+        """The abstract method adding many user reviews to the data storage at once.
+
+        Args:
+            data (list[UserReviewIn]): The details of the new user reviews.
+
+        Returns:
+            Iterable[UserReview]: The collection of the newly created user reviews.
+        """
+
     @abstractmethod
     async def delete_user_review(self, user_review_id: int) -> bool:
         """The abstract method remmoving user review from the data storage.
@@ -1,6 +1,7 @@
 """A module providing database access."""
 
 import asyncio
+from typing import Any, AsyncIterator
 
 from asyncpg.exceptions import (  # type: ignore
     CannotConnectNowError,
@@ -9,6 +10,7 @@ from asyncpg.exceptions import (  # type: ignore
 import databases
 import sqlalchemy
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
 from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.ext.asyncio import create_async_engine
 
@@ -156,24 +158,390 @@ user_review_table = sqlalchemy.Table(
     sqlalchemy.Column("comment", sqlalchemy.String, nullable=True),
 )
 
+user_rating_stats_table = sqlalchemy.Table(
+    "user_rating_stats",
+    metadata,
+    sqlalchemy.Column(
+        "user_id",
+        UUID(as_uuid=True),
+        sqlalchemy.ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column("sum_rating", sqlalchemy.BigInteger, nullable=False),
+    sqlalchemy.Column("review_count", sqlalchemy.Integer, nullable=False),
+)
+
+equipment_rating_stats_table = sqlalchemy.Table(
+    "equipment_rating_stats",
+    metadata,
+    sqlalchemy.Column(
+        "equipment_id",
+        sqlalchemy.Integer,
+        sqlalchemy.ForeignKey("equipment.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column("sum_rating", sqlalchemy.BigInteger, nullable=False),
+    sqlalchemy.Column("review_count", sqlalchemy.Integer, nullable=False),
+)
+
+# Indexes backing the filters of the repository queries. Kept as a list so
+# `init_db` can also add them to tables created before they were declared.
+indexes = [
+    sqlalchemy.Index(
+        "ix_equipment_reviews_equipment_id", equipment_review_table.c.equipment_id
+    ),
+    sqlalchemy.Index(
+        "ix_equipment_reviews_reviewer_id", equipment_review_table.c.reviewer_id
+    ),
+    sqlalchemy.Index(
+        "ix_reservations_user_id_status",
+        reservation_table.c.user_id,
+        reservation_table.c.status,
+    ),
+    sqlalchemy.Index("ix_reservations_equipment_id", reservation_table.c.equipment_id),
+    sqlalchemy.Index(
+        "ix_reservations_finished_equipment_id",
+        reservation_table.c.equipment_id,
+        postgresql_where=reservation_table.c.status == "finished",
+    ),
+    sqlalchemy.Index("ix_equipment_subcategory_id", equipment_table.c.subcategory_id),
+    sqlalchemy.Index("ix_subcategories_category_id", subcategory_table.c.category_id),
+    sqlalchemy.Index(
+        "ix_user_reviews_reviewed_user_id_id",
+        user_review_table.c.reviewed_user_id,
+        user_review_table.c.id.desc(),
+    ),
+    sqlalchemy.Index(
+        "ix_user_reviews_reviewer_id_id",
+        user_review_table.c.reviewer_id,
+        user_review_table.c.id.desc(),
+    ),
+]
+
+# The running sum and count of the ratings of each equipment are kept up
+# to date by a trigger on `equipment_reviews`, in the writing transaction.
+# The materialized view used before is dropped, and equipment reviewed
+# before the trigger existed is backfilled once from the reviews.
+EQUIPMENT_RATING_STATS_DDL = (
+    "DROP MATERIALIZED VIEW IF EXISTS equipment_avg_rating",
+    """
+    CREATE OR REPLACE FUNCTION update_equipment_rating_stats() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP <> 'INSERT' AND OLD.equipment_id IS NOT NULL THEN
+            UPDATE equipment_rating_stats
+            SET sum_rating = sum_rating - OLD.rating,
+                review_count = review_count - 1
+            WHERE equipment_id = OLD.equipment_id;
+        END IF;
+        IF TG_OP <> 'DELETE' AND NEW.equipment_id IS NOT NULL THEN
+            INSERT INTO equipment_rating_stats (equipment_id, sum_rating, review_count)
+            VALUES (NEW.equipment_id, NEW.rating, 1)
+            ON CONFLICT (equipment_id) DO UPDATE
+            SET sum_rating = equipment_rating_stats.sum_rating + EXCLUDED.sum_rating,
+                review_count = equipment_rating_stats.review_count + 1;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER equipment_reviews_rating_stats
+    AFTER INSERT OR UPDATE OF rating, equipment_id OR DELETE ON equipment_reviews
+    FOR EACH ROW EXECUTE FUNCTION update_equipment_rating_stats()
+    """,
+    """
+    INSERT INTO equipment_rating_stats (equipment_id, sum_rating, review_count)
+    SELECT equipment_id, SUM(rating), COUNT(*)
+    FROM equipment_reviews
+    WHERE equipment_id IS NOT NULL
+    GROUP BY equipment_id
+    ON CONFLICT (equipment_id) DO NOTHING
+    """,
+)
+
+# The same running totals are kept per reviewed user on `user_reviews`.
+USER_RATING_STATS_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION update_user_rating_stats() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP <> 'INSERT' AND OLD.reviewed_user_id IS NOT NULL THEN
+            UPDATE user_rating_stats
+            SET sum_rating = sum_rating - OLD.rating,
+                review_count = review_count - 1
+            WHERE user_id = OLD.reviewed_user_id;
+        END IF;
+        IF TG_OP <> 'DELETE' AND NEW.reviewed_user_id IS NOT NULL THEN
+            INSERT INTO user_rating_stats (user_id, sum_rating, review_count)
+            VALUES (NEW.reviewed_user_id, NEW.rating, 1)
+            ON CONFLICT (user_id) DO UPDATE
+            SET sum_rating = user_rating_stats.sum_rating + EXCLUDED.sum_rating,
+                review_count = user_rating_stats.review_count + 1;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER user_reviews_rating_stats
+    AFTER INSERT OR UPDATE OF rating, reviewed_user_id OR DELETE ON user_reviews
+    FOR EACH ROW EXECUTE FUNCTION update_user_rating_stats()
+    """,
+    """
+    INSERT INTO user_rating_stats (user_id, sum_rating, review_count)
+    SELECT reviewed_user_id, SUM(rating), COUNT(*)
+    FROM user_reviews
+    WHERE reviewed_user_id IS NOT NULL
+    GROUP BY reviewed_user_id
+    ON CONFLICT (user_id) DO NOTHING
+    """,
+)
+
+# Row changes are broadcast on the `cache_invalidate` channel so every app
+# process can drop its cached copies. Trigger arguments name the columns
+# copied into the payload, which keeps it far below the NOTIFY size limit.
+CACHE_INVALIDATION_CHANNEL = "cache_invalidate"
+
+CACHE_INVALIDATION_DDL = (
+    f"""
+    CREATE OR REPLACE FUNCTION notify_cache_invalidate() RETURNS trigger AS $$
+    DECLARE
+        changed jsonb := to_jsonb(CASE WHEN TG_OP = 'DELETE' THEN OLD ELSE NEW END);
+        payload jsonb := jsonb_build_object('table', TG_TABLE_NAME, 'op', TG_OP);
+        i integer;
+    BEGIN
+        FOR i IN 0 .. TG_NARGS - 1 LOOP
+            payload := payload || jsonb_build_object(TG_ARGV[i], changed -> TG_ARGV[i]);
+        END LOOP;
+        PERFORM pg_notify('{CACHE_INVALIDATION_CHANNEL}', payload::text);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER categories_cache_invalidate
+    AFTER INSERT OR UPDATE OR DELETE ON categories
+    FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidate()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER subcategories_cache_invalidate
+    AFTER INSERT OR UPDATE OR DELETE ON subcategories
+    FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidate()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER equipment_cache_invalidate
+    AFTER INSERT OR UPDATE OR DELETE ON equipment
+    FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidate('id')
+    """,
+    """
+    CREATE OR REPLACE TRIGGER reservations_cache_invalidate
+    AFTER INSERT OR UPDATE OR DELETE ON reservations
+    FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidate('equipment_id', 'status')
+    """,
+    """
+    CREATE OR REPLACE TRIGGER equipment_reviews_cache_invalidate
+    AFTER INSERT OR UPDATE OR DELETE ON equipment_reviews
+    FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidate('equipment_id')
+    """,
+    """
+    CREATE OR REPLACE TRIGGER user_reviews_cache_invalidate
+    AFTER INSERT OR UPDATE OR DELETE ON user_reviews
+    FOR EACH ROW EXECUTE FUNCTION notify_cache_invalidate('id', 'reviewed_user_id')
+    """,
+)
+
 
 db_uri = (
     f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
-    f"@{config.DB_HOST}/{config.DB_NAME}"
+    f"@{config.DB_HOST}:{config.DB_PORT}/{config.DB_NAME}"
+)
+
+# `db_uri` may point at PgBouncer in transaction mode. Schema setup and
+# LISTEN need a session of their own, so they reach the server directly.
+direct_db_host = config.DB_DIRECT_HOST or config.DB_HOST
+direct_db_uri = (
+    f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
+    f"@{direct_db_host}:{config.DB_DIRECT_PORT}/{config.DB_NAME}"
 )
 
 engine = create_async_engine(
-    db_uri,
+    direct_db_uri,
     echo=True,
     future=True,
     pool_pre_ping=True,
+    pool_recycle=config.DB_POOL_RECYCLE,
 )
 
+# One process-wide asyncpg pool shared by every repository. `min_size`
+# connections are opened on `database.connect()`, so the pool is warm
+# before the first request is served. Sizes are set per deployment through
+# the environment, so the total stays below the server's connection limit.
 database = databases.Database(
     db_uri,
+    min_size=config.DB_POOL_MIN_SIZE,
+    max_size=config.DB_POOL_MAX_SIZE,
+    max_queries=50000,
+    max_inactive_connection_lifetime=config.DB_POOL_MAX_INACTIVE_LIFETIME,
+    command_timeout=config.DB_COMMAND_TIMEOUT,
+    statement_cache_size=1024,
 )
 
 
+class PreparedQuery:
+    """A class running a query compiled once straight on the asyncpg connection.
+
+    The SQL text is built when the query is defined, so each call skips the
+    SQLAlchemy compilation done by `databases`. Reusing the same text lets
+    asyncpg's per-connection statement cache keep the query prepared, so
+    the server parses and plans it once per pooled connection.
+    """
+
+    _dialect = PGDialect_asyncpg()
+
+    _sql: str
+    _param_names: tuple[str, ...]
+
+    def __init__(self, query: sqlalchemy.ClauseElement) -> None:
+        """The initializer of the prepared query.
+
+        Args:
+            query (sqlalchemy.ClauseElement): The query with named bind parameters.
+        """
+        compiled = query.compile(dialect=self._dialect)
+        self._sql = str(compiled)
+        self._param_names = tuple(compiled.positiontup or ())
+
+    async def fetch_all(self, **params: Any) -> list[Any]:
+        """The method fetching all rows of the query.
+
+        Args:
+            **params (Any): The values of the bind parameters.
+
+        Returns:
+            list[Any]: The fetched records.
+        """
+        async with database.connection() as connection:
+            return await connection.raw_connection.fetch(self._sql, *self._args(params))
+
+    async def fetch_one(self, **params: Any) -> Any | None:
+        """The method fetching the first row of the query.
+
+        Args:
+            **params (Any): The values of the bind parameters.
+
+        Returns:
+            Any | None: The fetched record if exists.
+        """
+        async with database.connection() as connection:
+            return await connection.raw_connection.fetchrow(
+                self._sql, *self._args(params)
+            )
+
+    async def fetch_val(self, **params: Any) -> Any | None:
+        """The method fetching the first column of the first row of the query.
+
+        Args:
+            **params (Any): The values of the bind parameters.
+
+        Returns:
+            Any | None: The fetched value if exists.
+        """
+        async with database.connection() as connection:
+            return await connection.raw_connection.fetchval(
+                self._sql, *self._args(params)
+            )
+
+    def _args(self, params: dict[str, Any]) -> list[Any]:
+        """A private method ordering the parameters as the SQL text expects.
+
+        Args:
+            params (dict[str, Any]): The values of the bind parameters.
+
+        Returns:
+            list[Any]: The positional arguments of the query.
+        """
+        return [params[name] for name in self._param_names]
+
+
+class BatchedQuery:
+    """A class streaming the rows of a query in batches cut by a unique key.
+
+    Each batch is a separate short query, so no pooled connection nor
+    transaction is held while a slow client downloads the rows.
+    """
+
+    _first_batch: PreparedQuery
+    _next_batch: PreparedQuery
+    _key: str
+    _batch_size: int
+
+    def __init__(
+        self,
+        query: sqlalchemy.Select,
+        key: sqlalchemy.Column,
+        batch_size: int = 1000,
+    ) -> None:
+        """The initializer of the batched query.
+
+        Args:
+            query (sqlalchemy.Select): The query without ordering nor limit.
+            key (sqlalchemy.Column): The unique column the batches are cut by.
+            batch_size (int, optional): The number of rows in a batch.
+                Defaults to 1000.
+        """
+        batch = query.order_by(key).limit(sqlalchemy.bindparam("limit"))
+        self._first_batch = PreparedQuery(batch)
+        self._next_batch = PreparedQuery(
+            batch.where(key > sqlalchemy.bindparam("after", type_=key.type))
+        )
+        self._key = key.name
+        self._batch_size = batch_size
+
+    async def iterate(self) -> AsyncIterator[Any]:
+        """The method streaming all rows of the query ordered by the key.
+
+        Yields:
+            Any: The consecutive records.
+        """
+        rows = await self._first_batch.fetch_all(limit=self._batch_size)
+        while rows:
+            for row in rows:
+                yield row
+            if len(rows) < self._batch_size:
+                return
+            rows = await self._next_batch.fetch_all(
+                after=rows[-1][self._key], limit=self._batch_size
+            )
+
+
+def pool_stats() -> dict[str, int]:
+    """Function reporting the state of the connection pool.
+
+    Returns:
+        dict[str, int]: The configured bounds and current sizes of the pool,
+            empty if the database is not connected.
+    """
+    pool = getattr(database._backend, "_pool", None)
+    if pool is None:
+        return {}
+
+    return {
+        "min_size": pool.get_min_size(),
+        "max_size": pool.get_max_size(),
+        "size": pool.get_size(),
+        "idle": pool.get_idle_size(),
+    }
+
+
+def _create_indexes(connection: sqlalchemy.Connection) -> None:
+    """Function creating the indexes missing in the existing tables.
+
+    Args:
+        connection (sqlalchemy.Connection): The DB connection.
+    """
+    for index in indexes:
+        index.create(connection, checkfirst=True)
+
+
 async def init_db(retries: int = 5, delay: int = 5) -> None:
     """Function initializing the DB.
 
@@ -186,6 +554,13 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
         try:
             async with engine.begin() as conn:
                 await conn.run_sync(metadata.create_all)
+                await conn.run_sync(_create_indexes)
+                for statement in (
+                    EQUIPMENT_RATING_STATS_DDL
+                    + USER_RATING_STATS_DDL
+                    + CACHE_INVALIDATION_DDL
+                ):
+                    await conn.execute(sqlalchemy.text(statement))
             return
         except (
             OperationalError,
@@ -197,3 +572,9 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
             await asyncio.sleep(delay)
 
     raise ConnectionError("Could not connect to DB after several retries.")
+
+
+if __name__ == "__main__":
+    # Applies the schema once per deployment, e.g. `python -m src.db`,
+    # so workers started with DB_INIT_ON_STARTUP=false skip it.
+    asyncio.run(init_db())
@@ -3,12 +3,17 @@
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import bindparam, delete, insert, select, update
 
 from src.core.domain.category import Category, CategoryIn
 from src.core.repositories.icategory import ICategoryRepository
 from src.db import category_table, database
 
+_SELECT_ALL = select(category_table).order_by(category_table.c.name.asc())
+_SELECT_BY_ID = select(category_table).where(
+    category_table.c.id == bindparam("category_id")
+)
+
 
 class CategoryRepository(ICategoryRepository):
     """A class implementing the category repository."""
@@ -19,8 +24,7 @@ class CategoryRepository(ICategoryRepository):
         Returns:
             Iterable[Any]: The collection of the all categories.
         """
-        query = select(category_table).order_by(category_table.c.name.asc())
-        categories = await database.fetch_all(query)
+        categories = await database.fetch_all(_SELECT_ALL)
         return [Category(**dict(category)) for category in categories]
 
     async def get_category_by_id(self, category_id: int) -> Category | None:
@@ -94,9 +98,5 @@ class CategoryRepository(ICategoryRepository):
         Returns:
             Record | None: Category record if exists.
         """
-        query = (
-            select(category_table)
-            .where(category_table.c.id == category_id)
-            .order_by(category_table.c.name.asc())
-        )
+        query = _SELECT_BY_ID.params(category_id=category_id)
         return await database.fetch_one(query)
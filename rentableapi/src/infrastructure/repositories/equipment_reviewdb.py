@@ -1,31 +1,92 @@
 """Module containing equipment review database repository implementation."""
 
-from typing import Iterable
+from typing import AsyncIterator, Iterable
+from uuid import UUID
 
 from asyncpg import Record  # type: ignore
-from pydantic import UUID4
-from sqlalchemy import delete, func, insert, select
+from sqlalchemy import (
+    ARRAY,
+    Float,
+    Integer,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+)
 
 from src.core.domain.equipment_review import (
     EquipmentReview,
     EquipmentReviewIn,
 )
 from src.core.repositories.iequipment_review import IEquipmentReviewRepository
-from src.db import database, equipment_review_table, equipment_table
+from src.db import (
+    BatchedQuery,
+    PreparedQuery,
+    database,
+    equipment_rating_stats_table,
+    equipment_review_table,
+    equipment_table,
+)
+
+_SELECT_ALL = BatchedQuery(
+    select(equipment_review_table), equipment_review_table.c.id
+)
+_SELECT_BY_ID = select(equipment_review_table).where(
+    equipment_review_table.c.id == bindparam("equipment_review_id")
+)
+_SELECT_BY_EQUIPMENT_ID = PreparedQuery(
+    select(equipment_review_table).where(
+        equipment_review_table.c.equipment_id == bindparam("equipment_id")
+    )
+)
+_SELECT_BY_EQUIPMENT_IDS = select(equipment_review_table).where(
+    equipment_review_table.c.equipment_id
+    == any_(bindparam("equipment_ids", type_=ARRAY(Integer)))
+)
+_SELECT_BY_REVIEWER_ID = PreparedQuery(
+    select(equipment_review_table).where(
+        equipment_review_table.c.reviewer_id == bindparam("reviewer_id")
+    )
+)
+_AVERAGE_RATING = cast(equipment_rating_stats_table.c.sum_rating, Float) / func.nullif(
+    equipment_rating_stats_table.c.review_count, literal_column("0"), type_=Float
+)
+_SELECT_AVERAGE_RATING = select(_AVERAGE_RATING).where(
+    equipment_rating_stats_table.c.equipment_id == bindparam("equipment_id")
+)
+_SELECT_AVERAGE_RATINGS = select(
+    equipment_rating_stats_table.c.equipment_id,
+    _AVERAGE_RATING.label("average_rating"),
+).where(
+    equipment_rating_stats_table.c.equipment_id
+    == any_(bindparam("equipment_ids", type_=ARRAY(Integer)))
+)
 
 
 class EquipmentReviewRepository(IEquipmentReviewRepository):
     """A class implementing the equipment review repository."""
 
-    async def get_all_equipment_reviews(self) -> Iterable[EquipmentReview]:
-        """The method getting all equipment reviews from the database.
+    async def get_all_equipment_reviews(self) -> AsyncIterator[EquipmentReview]:
+        """The method streaming all equipment reviews from the database.
 
-        Returns:
-            Iterable[EquipmentReview]: The collection of all equipment reviews.
+        Yields:
+            EquipmentReview: The consecutive equipment reviews.
         """
-        query = select(equipment_review_table)
-        reviews = await database.fetch_all(query)
-        return [EquipmentReview(**dict(review)) for review in reviews]
+        async for review in _SELECT_ALL.iterate():
+            yield EquipmentReview(**dict(review))
+
+    async def get_all_equipment_reviews_raw(self) -> AsyncIterator[Record]:
+        """The method streaming all equipment review rows from the database.
+
+        Yields:
+            Record: The consecutive equipment review rows.
+        """
+        async for review in _SELECT_ALL.iterate():
+            yield review
 
     async def get_equipment_review_by_id(
         self, equipment_review_id: int
@@ -52,44 +113,77 @@ class EquipmentReviewRepository(IEquipmentReviewRepository):
         Returns:
             Iterable[EquipmentReview] | None: The collection of the all equipment reviews if exists.
         """
-        query = select(equipment_review_table).where(
-            equipment_review_table.c.equipment_id == equipment_id
-        )
-        reviews = await database.fetch_all(query)
+        reviews = await _SELECT_BY_EQUIPMENT_ID.fetch_all(equipment_id=equipment_id)
         return [EquipmentReview(**dict(review)) for review in reviews]
 
+    async def get_reviews_by_equipment_ids(
+        self, equipment_ids: list[int]
+    ) -> dict[int, list[EquipmentReview]]:
+        """The method getting equipment reviews for many equipments with one query.
+
+        Args:
+            equipment_ids (list[int]): The ids of the equipments.
+
+        Returns:
+            dict[int, list[EquipmentReview]]: The reviews grouped by equipment id.
+        """
+        query = _SELECT_BY_EQUIPMENT_IDS.params(equipment_ids=equipment_ids)
+        reviews: dict[int, list[EquipmentReview]] = {}
+        for review in await database.fetch_all(query):
+            reviews.setdefault(review["equipment_id"], []).append(
+                EquipmentReview(**dict(review))
+            )
+        return reviews
+
     async def get_reviews_by_reviewer_id(
-        self, reviewer_id: UUID4
+        self, reviewer_id: UUID
     ) -> Iterable[EquipmentReview]:
         """The method getting all equipment reviews from the database based on provided reviewer id.
 
         Args:
-            reviewer_id (UUID4): The UUID of the reviewer
+            reviewer_id (UUID): The UUID of the reviewer
 
         Returns:
             Iterable[EquipmentReview] | None: The collection of the all equipment reviews if exists.
         """
-        query = select(equipment_review_table).where(
-            equipment_review_table.c.reviewer_id == reviewer_id
-        )
-        reviews = await database.fetch_all(query)
+        reviews = await _SELECT_BY_REVIEWER_ID.fetch_all(reviewer_id=reviewer_id)
         return [EquipmentReview(**dict(review)) for review in reviews]
 
     async def get_average_rating_for_equipment(self, equipment_id: int) -> float | None:
         """The method getting average rating for equipment from the database based on provided equipment id.
 
+        The rating is read from the running sum and count kept per
+        equipment, so it costs a single primary key lookup.
+
         Args:
             equipment_id (int): The id of the equipment
 
         Returns:
             float | None: The average rating if exists.
         """
-        query = select(func.avg(equipment_review_table.c.rating)).where(
-            equipment_review_table.c.equipment_id == equipment_id
-        )
+        query = _SELECT_AVERAGE_RATING.params(equipment_id=equipment_id)
         result = await database.fetch_val(query)
         return float(result) if result is not None else None
 
+    async def get_average_ratings_for_equipments(
+        self, equipment_ids: list[int]
+    ) -> dict[int, float]:
+        """The method getting average ratings for many equipments with one query.
+
+        Args:
+            equipment_ids (list[int]): The ids of the equipments.
+
+        Returns:
+            dict[int, float]: The average ratings of the reviewed equipments.
+        """
+        query = _SELECT_AVERAGE_RATINGS.params(equipment_ids=equipment_ids)
+        results = await database.fetch_all(query)
+        return {
+            row["equipment_id"]: float(row["average_rating"])
+            for row in results
+            if row["average_rating"] is not None
+        }
+
     async def add_equipment_review(
         self, data: EquipmentReviewIn
     ) -> EquipmentReview | None:
@@ -110,22 +204,24 @@ class EquipmentReviewRepository(IEquipmentReviewRepository):
             else None
         )
 
-    async def delete_equipment_review(self, equipment_review_id: int) -> bool:
+    async def delete_equipment_review(
+        self, equipment_review_id: int
+    ) -> EquipmentReview | None:
         """The method removing equipment review from the database.
 
         Args:
             equipment_review_id (int): The id of the equipment review.
 
         Returns:
-            bool: Success of the operation.
+            EquipmentReview | None: The deleted equipment review if existed.
         """
-        if await self._get_by_id(equipment_review_id):
-            query = delete(equipment_review_table).where(
-                equipment_review_table.c.id == equipment_review_id
-            )
-            await database.execute(query)
-            return True
-        return False
+        query = (
+            delete(equipment_review_table)
+            .where(equipment_review_table.c.id == equipment_review_id)
+            .returning(equipment_review_table)
+        )
+        review = await database.fetch_one(query)
+        return EquipmentReview(**dict(review)) if review else None
 
     async def _get_by_id(self, equipment_review_id: int) -> Record | None:
         """The method getting equipment review from the database based on its ID.
@@ -136,7 +232,5 @@ class EquipmentReviewRepository(IEquipmentReviewRepository):
         Returns:
             Record | None: The equipment review record if exists.
         """
-        query = select(equipment_review_table).where(
-            equipment_review_table.c.id == equipment_review_id
-        )
+        query = _SELECT_BY_ID.params(equipment_review_id=equipment_review_id)
         return await database.fetch_one(query)
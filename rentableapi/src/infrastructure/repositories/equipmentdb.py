@@ -3,12 +3,26 @@
 from typing import Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import bindparam, delete, insert, select, update
 
 from src.core.domain.equipment import Equipment, EquipmentIn
 from src.core.repositories.iequipment import IEquipmentRepository
 from src.db import database, equipment_table, subcategory_table
 
+_SELECT_WITH_CATEGORY = select(equipment_table, subcategory_table.c.category_id).join(
+    subcategory_table,
+    equipment_table.c.subcategory_id == subcategory_table.c.id,
+)
+_SELECT_BY_CATEGORY_ID = _SELECT_WITH_CATEGORY.where(
+    subcategory_table.c.category_id == bindparam("category_id")
+)
+_SELECT_BY_SUBCATEGORY_ID = _SELECT_WITH_CATEGORY.where(
+    equipment_table.c.subcategory_id == bindparam("subcategory_id")
+)
+_SELECT_BY_ID = _SELECT_WITH_CATEGORY.where(
+    equipment_table.c.id == bindparam("equipment_id")
+)
+
 
 class EquipmentRepository(IEquipmentRepository):
     """A class implementing the equipment repository."""
@@ -19,13 +33,18 @@ class EquipmentRepository(IEquipmentRepository):
         Returns:
             Iterable[Equipment]: The collection of the all equipments.
         """
-        query = select(equipment_table, subcategory_table.c.category_id).join(
-            subcategory_table,
-            equipment_table.c.subcategory_id == subcategory_table.c.id,
-        )
-        equipments = await database.fetch_all(query)
+        equipments = await database.fetch_all(_SELECT_WITH_CATEGORY)
         return [Equipment(**dict(equipment)) for equipment in equipments]
 
+    async def get_all_equipments_raw(self) -> Iterable[Record]:
+        """The method getting all equipment rows from the database.
+
+        Returns:
+            Iterable[Record]: The rows of all equipment.
+        """
+        equipments = await database.fetch_all(_SELECT_WITH_CATEGORY)
+        return [equipment._mapping for equipment in equipments]
+
     async def get_equipment_by_id(self, equipment_id: int) -> Equipment | None:
         """The method getting equipment from the database based on its ID.
 
@@ -49,14 +68,7 @@ class EquipmentRepository(IEquipmentRepository):
         Returns:
             Iterable[Equipment]: The collection of the all equipments.
         """
-        query = (
-            select(equipment_table, subcategory_table.c.category_id)
-            .join(
-                subcategory_table,
-                equipment_table.c.subcategory_id == subcategory_table.c.id,
-            )
-            .where(subcategory_table.c.category_id == category_id)
-        )
+        query = _SELECT_BY_CATEGORY_ID.params(category_id=category_id)
         equipments = await database.fetch_all(query)
         return [Equipment(**dict(equipment)) for equipment in equipments]
 
@@ -71,14 +83,7 @@ class EquipmentRepository(IEquipmentRepository):
         Returns:
             Iterable[Equipment]: The collection of the all equipments.
         """
-        query = (
-            select(equipment_table, subcategory_table.c.category_id)
-            .join(
-                subcategory_table,
-                equipment_table.c.subcategory_id == subcategory_table.c.id,
-            )
-            .where(equipment_table.c.subcategory_id == subcategory_id)
-        )
+        query = _SELECT_BY_SUBCATEGORY_ID.params(subcategory_id=subcategory_id)
         equipments = await database.fetch_all(query)
         return [Equipment(**dict(equipment)) for equipment in equipments]
 
@@ -143,12 +148,5 @@ class EquipmentRepository(IEquipmentRepository):
         Returns:
             Record | None: The equipment record if exists.
         """
-        query = (
-            select(equipment_table, subcategory_table.c.category_id)
-            .join(
-                subcategory_table,
-                equipment_table.c.subcategory_id == subcategory_table.c.id,
-            )
-            .where(equipment_table.c.id == equipment_id)
-        )
+        query = _SELECT_BY_ID.params(equipment_id=equipment_id)
         return await database.fetch_one(query)
@@ -1,15 +1,31 @@
 """Module containing reservation database repository implementation."""
 
 from datetime import date
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable
+from uuid import UUID
 
 from asyncpg import Record  # type: ignore
-from pydantic import UUID4
-from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy import (
+    ARRAY,
+    Column,
+    Integer,
+    Select,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 from src.core.domain.reservation import Reservation, ReservationIn
 from src.core.repositories.ireservation import IReservationRepository
 from src.db import (
+    BatchedQuery,
+    PreparedQuery,
     category_table,
     database,
     equipment_table,
@@ -19,19 +35,143 @@ from src.db import (
 )
 
 
+def _select_by_equipment_attr(column: Column) -> Select:
+    """A function building a query for reservations of matching equipment.
+
+    Args:
+        column (Column): The equipment (or its subcategory) column to filter on.
+
+    Returns:
+        Select: The query with a `value` bind parameter.
+    """
+    return select(reservation_table).where(
+        reservation_table.c.equipment_id.in_(
+            select(equipment_table.c.id)
+            .join(
+                subcategory_table,
+                equipment_table.c.subcategory_id == subcategory_table.c.id,
+            )
+            .where(column == bindparam("value"))
+        )
+    )
+
+
+def _select_batch_by_equipment_attr(column: Column) -> Select:
+    """A function building a batched query for reservations of matching equipment.
+
+    Args:
+        column (Column): The equipment (or its subcategory) column to filter on.
+
+    Returns:
+        Select: The query with a `values` array bind parameter, labelling
+            the matched column value as `key`.
+    """
+    return (
+        select(reservation_table, column.label("key"))
+        .join(
+            equipment_table,
+            reservation_table.c.equipment_id == equipment_table.c.id,
+        )
+        .join(
+            subcategory_table,
+            equipment_table.c.subcategory_id == subcategory_table.c.id,
+        )
+        .where(column == any_(bindparam("values", type_=ARRAY(Integer))))
+    )
+
+
+def _group_by_key(records: Iterable[Record], key: str) -> dict[Any, list[Reservation]]:
+    """A function grouping reservation records by the provided column.
+
+    Args:
+        records (Iterable[Record]): The reservation records.
+        key (str): The name of the grouping column.
+
+    Returns:
+        dict[Any, list[Reservation]]: The reservations grouped by the column value.
+    """
+    reservations: dict[Any, list[Reservation]] = {}
+    for record in records:
+        reservations.setdefault(record[key], []).append(
+            Reservation.model_construct(**record)
+        )
+    return reservations
+
+
+_SELECT_ALL = BatchedQuery(select(reservation_table), reservation_table.c.id)
+_SELECT_BY_ID = PreparedQuery(
+    select(reservation_table).where(
+        reservation_table.c.id == bindparam("reservation_id")
+    )
+)
+_SELECT_BY_USER_ID = select(reservation_table).where(
+    reservation_table.c.user_id == bindparam("user_id")
+)
+_SELECT_BY_EQUIPMENT_ID = select(reservation_table).where(
+    reservation_table.c.equipment_id == bindparam("equipment_id")
+)
+_SELECT_BY_USER_IDS = PreparedQuery(
+    select(reservation_table).where(
+        reservation_table.c.user_id
+        == any_(bindparam("user_ids", type_=ARRAY(PG_UUID(as_uuid=True))))
+    )
+)
+_SELECT_BY_EQUIPMENT_IDS = PreparedQuery(
+    select(reservation_table).where(
+        reservation_table.c.equipment_id
+        == any_(bindparam("equipment_ids", type_=ARRAY(Integer)))
+    )
+)
+_SELECT_BY_EQUIPMENT_ATTR = {
+    column: _select_by_equipment_attr(column)
+    for column in (subcategory_table.c.category_id, equipment_table.c.subcategory_id)
+}
+_SELECT_BATCH_BY_EQUIPMENT_ATTR = {
+    column: _select_batch_by_equipment_attr(column)
+    for column in (subcategory_table.c.category_id, equipment_table.c.subcategory_id)
+}
+_SELECT_MOST_RENTED = (
+    select(
+        reservation_table.c.equipment_id,
+        func.count().label("count"),
+    )
+    # An inline literal (not a bind parameter) lets the planner match the
+    # partial index on finished reservations even with a generic plan.
+    .where(
+        reservation_table.c.status == literal_column("'finished'"),
+        reservation_table.c.equipment_id.is_not(None),
+    )
+    .group_by(reservation_table.c.equipment_id)
+    .order_by(func.count().desc())
+    .limit(bindparam("limit"))
+)
+_SELECT_PRICE_PER_DAY = PreparedQuery(
+    select(equipment_table.c.price_per_day).where(
+        equipment_table.c.id == bindparam("equipment_id")
+    )
+)
+
+
 class ReservationRepository(IReservationRepository):
     """A class implementing the reservation repository."""
 
-    async def get_all_reservations(self) -> Iterable[Reservation]:
-        """The method getting all reservations from the database.
+    async def get_all_reservations(self) -> AsyncIterator[Reservation]:
+        """The method streaming all reservations from the database.
 
-        Returns:
-            Iterable[Reservation]: The collection of the all reservations.
+        Yields:
+            Reservation: The consecutive reservations.
         """
-        query = select(reservation_table)
+        async for reservation in _SELECT_ALL.iterate():
+            yield Reservation.model_construct(**reservation)
 
-        reservations = await database.fetch_all(query)
-        return [Reservation(**dict(reservation)) for reservation in reservations]
+    async def get_all_reservations_raw(self) -> AsyncIterator[Record]:
+        """The method streaming all reservation rows from the database.
+
+        Yields:
+            Record: The consecutive reservation rows.
+        """
+        async for reservation in _SELECT_ALL.iterate():
+            yield reservation
 
     async def get_reservation_by_id(self, reservation_id: int) -> Reservation | None:
         """The method getting reservation from the database based on its ID.
@@ -46,19 +186,21 @@ class ReservationRepository(IReservationRepository):
         return Reservation(**dict(reservation)) if reservation else None
 
     async def get_all_reservations_by_user(
-        self, user_id: UUID4
+        self, user_id: UUID
     ) -> Iterable[Reservation]:
         """The method getting all reservations from the database based on its user ID.
 
         Args:
-            user_id (UUID4): The UUID of the user.
+            user_id (UUID): The UUID of the user.
 
         Returns:
             Iterable[Reservation]: The collection of the all reservations.
         """
-        query = select(reservation_table).where(reservation_table.c.user_id == user_id)
+        query = _SELECT_BY_USER_ID.params(user_id=user_id)
         reservations = await database.fetch_all(query)
-        return [Reservation(**dict(reservation)) for reservation in reservations]
+        return [
+            Reservation.model_construct(**reservation) for reservation in reservations
+        ]
 
     async def get_all_reservations_by_equipment_id(
         self, equipment_id: int
@@ -71,11 +213,11 @@ class ReservationRepository(IReservationRepository):
         Returns:
             Iterable[Reservation]: The collection of the all reservations.
         """
-        query = select(reservation_table).where(
-            reservation_table.c.equipment_id == equipment_id
-        )
+        query = _SELECT_BY_EQUIPMENT_ID.params(equipment_id=equipment_id)
         reservations = await database.fetch_all(query)
-        return [Reservation(**dict(reservation)) for reservation in reservations]
+        return [
+            Reservation.model_construct(**reservation) for reservation in reservations
+        ]
 
     async def get_all_reservations_by_category_id(
         self, category_id: int
@@ -88,28 +230,9 @@ class ReservationRepository(IReservationRepository):
         Returns:
             Iterable[Reservation]: The collection of the all reservations.
         """
-        query = (
-            select(
-                reservation_table.c.id,
-                reservation_table.c.user_id,
-                reservation_table.c.equipment_id,
-                reservation_table.c.start_date,
-                reservation_table.c.end_date,
-                reservation_table.c.status,
-                reservation_table.c.total_price,
-            )
-            .join(
-                equipment_table,
-                reservation_table.c.equipment_id == equipment_table.c.id,
-            )
-            .join(
-                subcategory_table,
-                equipment_table.c.subcategory_id == subcategory_table.c.id,
-            )
-            .where(subcategory_table.c.category_id == category_id)
+        return await self._get_all_by_equipment_attr(
+            subcategory_table.c.category_id, category_id
         )
-        reservations = await database.fetch_all(query)
-        return [Reservation(**dict(reservation)) for reservation in reservations]
 
     async def get_all_reservations_by_subcategory_id(
         self, subcategory_id: int
@@ -122,24 +245,71 @@ class ReservationRepository(IReservationRepository):
         Returns:
             Iterable[Reservation]: The collection of the all reservations.
         """
-        query = (
-            select(
-                reservation_table.c.id,
-                reservation_table.c.user_id,
-                reservation_table.c.equipment_id,
-                reservation_table.c.start_date,
-                reservation_table.c.end_date,
-                reservation_table.c.status,
-                reservation_table.c.total_price,
-            )
-            .join(
-                equipment_table,
-                reservation_table.c.equipment_id == equipment_table.c.id,
-            )
-            .where(equipment_table.c.subcategory_id == subcategory_id)
+        return await self._get_all_by_equipment_attr(
+            equipment_table.c.subcategory_id, subcategory_id
+        )
+
+    async def get_reservations_for_user_ids(
+        self, user_ids: list[UUID]
+    ) -> dict[UUID, list[Reservation]]:
+        """The method getting reservations of many users with one query.
+
+        Args:
+            user_ids (list[UUID]): The UUIDs of the users.
+
+        Returns:
+            dict[UUID, list[Reservation]]: The reservations grouped by user UUID.
+        """
+        reservations = await _SELECT_BY_USER_IDS.fetch_all(user_ids=user_ids)
+        return _group_by_key(reservations, "user_id")
+
+    async def get_reservations_for_equipment_ids(
+        self, equipment_ids: list[int]
+    ) -> dict[int, list[Reservation]]:
+        """The method getting reservations of many equipments with one query.
+
+        Args:
+            equipment_ids (list[int]): The ids of the equipments.
+
+        Returns:
+            dict[int, list[Reservation]]: The reservations grouped by equipment id.
+        """
+        reservations = await _SELECT_BY_EQUIPMENT_IDS.fetch_all(
+            equipment_ids=equipment_ids
+        )
+        return _group_by_key(reservations, "equipment_id")
+
+    async def get_reservations_for_category_ids(
+        self, category_ids: list[int]
+    ) -> dict[int, list[Reservation]]:
+        """The method getting reservations of many categories with one query.
+
+        Args:
+            category_ids (list[int]): The ids of the categories.
+
+        Returns:
+            dict[int, list[Reservation]]: The reservations grouped by category id.
+        """
+        query = _SELECT_BATCH_BY_EQUIPMENT_ATTR[subcategory_table.c.category_id]
+        return _group_by_key(
+            await database.fetch_all(query.params(values=category_ids)), "key"
+        )
+
+    async def get_reservations_for_subcategory_ids(
+        self, subcategory_ids: list[int]
+    ) -> dict[int, list[Reservation]]:
+        """The method getting reservations of many subcategories with one query.
+
+        Args:
+            subcategory_ids (list[int]): The ids of the subcategories.
+
+        Returns:
+            dict[int, list[Reservation]]: The reservations grouped by subcategory id.
+        """
+        query = _SELECT_BATCH_BY_EQUIPMENT_ATTR[equipment_table.c.subcategory_id]
+        return _group_by_key(
+            await database.fetch_all(query.params(values=subcategory_ids)), "key"
         )
-        reservations = await database.fetch_all(query)
-        return [Reservation(**dict(reservation)) for reservation in reservations]
 
     async def add_reservation(self, data: ReservationIn) -> Reservation | None:
         """The method adding new reservation to the database.
@@ -156,6 +326,32 @@ class ReservationRepository(IReservationRepository):
         new_reservation = await self._get_by_id(new_reservation_id)
         return Reservation(**dict(new_reservation)) if new_reservation else None
 
+    async def add_reservations_bulk(
+        self, data: list[ReservationIn]
+    ) -> Iterable[Reservation]:
+        """The method adding many reservations to the database at once.
+
+        All rows are sent as a single multi-row INSERT ... RETURNING statement.
+
+        Args:
+            data (list[ReservationIn]): The attributes of the reservations.
+
+        Returns:
+            Iterable[Reservation]: The collection of the newly created reservations.
+        """
+        if not data:
+            return []
+
+        query = (
+            insert(reservation_table)
+            .values([reservation.model_dump() for reservation in data])
+            .returning(reservation_table)
+        )
+        reservations = await database.fetch_all(query)
+        return [
+            Reservation.model_construct(**reservation) for reservation in reservations
+        ]
+
     async def update_reservation(
         self, reservation_id: int, data: ReservationIn
     ) -> Reservation | None:
@@ -200,27 +396,41 @@ class ReservationRepository(IReservationRepository):
             return True
         return False
 
-    async def get_most_rented_equipment_ids(self, limit: int) -> Iterable[dict]:
+    async def get_most_rented_equipment_ids(
+        self, limit: int
+    ) -> tuple[list[int], list[int]]:
         """The method getting most rented equipment IDs from the database.
 
         Args:
             limit (int): The limit of the most rented equipment IDs.
 
         Returns:
-            Iterable[dict]: The collection of the most rented equipment IDs.
+            tuple[list[int], list[int]]: The equipment IDs and their rent counts.
         """
-        query = (
-            select(
-                reservation_table.c.equipment_id,
-                func.count(reservation_table.c.id).label("count"),
-            )
-            .where(reservation_table.c.status == "finished")
-            .group_by(reservation_table.c.equipment_id)
-            .order_by(func.count(reservation_table.c.id).desc())
-            .limit(limit)
-        )
+        query = _SELECT_MOST_RENTED.params(limit=limit)
         results = await database.fetch_all(query)
-        return [dict(row) for row in results]
+        return (
+            [row["equipment_id"] for row in results],
+            [row["count"] for row in results],
+        )
+
+    async def _get_all_by_equipment_attr(
+        self, column: Column, value: int
+    ) -> Iterable[Reservation]:
+        """The method getting all reservations of equipment matching the column.
+
+        Args:
+            column (Column): The equipment (or its subcategory) column to filter on.
+            value (int): The value of the column.
+
+        Returns:
+            Iterable[Reservation]: The collection of the all reservations.
+        """
+        query = _SELECT_BY_EQUIPMENT_ATTR[column].params(value=value)
+        reservations = await database.fetch_all(query)
+        return [
+            Reservation.model_construct(**reservation) for reservation in reservations
+        ]
 
     async def _get_by_id(self, reservation_id: int) -> Record | None:
         """The method getting reservation from the database based on its ID.
@@ -231,10 +441,7 @@ class ReservationRepository(IReservationRepository):
         Returns:
             Record | None: The reservation record if exists.
         """
-        query = select(reservation_table).where(
-            reservation_table.c.id == reservation_id
-        )
-        return await database.fetch_one(query)
+        return await _SELECT_BY_ID.fetch_one(reservation_id=reservation_id)
 
     async def calculate_total_price(
         self, equipment_id: int, start_date: date, end_date: date
@@ -249,10 +456,7 @@ class ReservationRepository(IReservationRepository):
         Returns:
             float: The total price of the reservation.
         """
-        query = select(equipment_table.c.price_per_day).where(
-            equipment_table.c.id == equipment_id
-        )
-        equipment = await database.fetch_one(query)
+        equipment = await _SELECT_PRICE_PER_DAY.fetch_one(equipment_id=equipment_id)
 
         if not equipment:
             return 0.0
@@ -3,11 +3,28 @@
 from typing import Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import delete, insert, join, select, update
+from sqlalchemy import bindparam, delete, insert, join, select, update
 
 from src.core.domain.subcategory import Subcategory, SubcategoryIn
 from src.core.repositories.isubcategory import ISubcategoryRepository
-from src.db import category_table, database, subcategory_table
+from src.db import PreparedQuery, category_table, database, subcategory_table
+
+_SELECT_WITH_CATEGORY = select(
+    subcategory_table, category_table.c.id.label("category_id")
+).select_from(
+    join(
+        subcategory_table,
+        category_table,
+        subcategory_table.c.category_id == category_table.c.id,
+    )
+)
+_SELECT_ALL = _SELECT_WITH_CATEGORY.order_by(subcategory_table.c.name.asc())
+_SELECT_BY_CATEGORY_ID = _SELECT_WITH_CATEGORY.where(
+    subcategory_table.c.category_id == bindparam("category_id")
+).order_by(subcategory_table.c.name.asc())
+_SELECT_BY_ID = PreparedQuery(
+    _SELECT_WITH_CATEGORY.where(subcategory_table.c.id == bindparam("subcategory_id"))
+)
 
 
 class SubcategoryRepository(ISubcategoryRepository):
@@ -19,18 +36,7 @@ class SubcategoryRepository(ISubcategoryRepository):
         Returns:
             Iterable[Any]: The collection of the all subcategories.
         """
-        query = (
-            select(subcategory_table, category_table.c.id.label("category_id"))
-            .select_from(
-                join(
-                    subcategory_table,
-                    category_table,
-                    subcategory_table.c.category_id == category_table.c.id,
-                )
-            )
-            .order_by(subcategory_table.c.name.asc())
-        )
-        subcategories = await database.fetch_all(query)
+        subcategories = await database.fetch_all(_SELECT_ALL)
         return [Subcategory(**dict(subsubcategory)) for subsubcategory in subcategories]
 
     async def get_subcategory_by_id(self, subcategory_id: int) -> Subcategory | None:
@@ -56,18 +62,7 @@ class SubcategoryRepository(ISubcategoryRepository):
         Returns:
             Iterable[Subcategory]: The collection of the all subcategories for provided category.
         """
-        query = (
-            select(subcategory_table, category_table.c.id.label("category_id"))
-            .select_from(
-                join(
-                    subcategory_table,
-                    category_table,
-                    subcategory_table.c.category_id == category_table.c.id,
-                )
-            )
-            .where(subcategory_table.c.category_id == category_id)
-            .order_by(subcategory_table.c.name.asc())
-        )
+        query = _SELECT_BY_CATEGORY_ID.params(category_id=category_id)
         subcategories = await database.fetch_all(query)
         return [Subcategory(**dict(subcategory)) for subcategory in subcategories]
 
@@ -138,15 +133,4 @@ class SubcategoryRepository(ISubcategoryRepository):
         Returns:
             Record | None: Subcategory record if exists.
         """
-        query = (
-            select(subcategory_table, category_table.c.id.label("category_id"))
-            .select_from(
-                join(
-                    subcategory_table,
-                    category_table,
-                    subcategory_table.c.category_id == category_table.c.id,
-                )
-            )
-            .where(subcategory_table.c.id == subcategory_id)
-        )
-        return await database.fetch_one(query)
+        return await _SELECT_BY_ID.fetch_one(subcategory_id=subcategory_id)
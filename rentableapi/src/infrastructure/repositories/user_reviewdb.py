@@ -1,28 +1,104 @@
 """Module containing user review database repository implementation."""
 
-from typing import Iterable
+from typing import AsyncIterator, Iterable
+from uuid import UUID
 
 from asyncpg import Record  # type: ignore
-from pydantic import UUID4
-from sqlalchemy import delete, func, insert, select
+from sqlalchemy import (
+    ARRAY,
+    Float,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 from src.core.domain.user_review import UserReview, UserReviewIn
 from src.core.repositories.iuser_review import IUserReviewRepository
-from src.db import database, user_review_table
+from src.db import (
+    BatchedQuery,
+    PreparedQuery,
+    database,
+    user_rating_stats_table,
+    user_review_table,
+)
+
+
+def _group_by_key(records: Iterable[Record], key: str) -> dict[UUID, list[UserReview]]:
+    """A function grouping user review records by the provided column.
+
+    Args:
+        records (Iterable[Record]): The user review records.
+        key (str): The name of the grouping column.
+
+    Returns:
+        dict[UUID, list[UserReview]]: The user reviews grouped by the column value.
+    """
+    reviews: dict[UUID, list[UserReview]] = {}
+    for record in records:
+        reviews.setdefault(record[key], []).append(UserReview.model_construct(**record))
+    return reviews
+
+
+_SELECT_ALL = BatchedQuery(select(user_review_table), user_review_table.c.id)
+_SELECT_BY_ID = PreparedQuery(
+    select(user_review_table).where(
+        user_review_table.c.id == bindparam("user_review_id")
+    )
+)
+_SELECT_SENT = select(user_review_table).where(
+    user_review_table.c.reviewer_id == bindparam("user_id")
+)
+_SELECT_RECEIVED = select(user_review_table).where(
+    user_review_table.c.reviewed_user_id == bindparam("user_id")
+)
+_SELECT_RECEIVED_NEWEST = (
+    _SELECT_RECEIVED.order_by(user_review_table.c.id.desc()).limit(bindparam("limit"))
+)
+_SELECT_RECEIVED_FIRST_PAGE = PreparedQuery(_SELECT_RECEIVED_NEWEST)
+_SELECT_RECEIVED_NEXT_PAGE = PreparedQuery(
+    _SELECT_RECEIVED_NEWEST.where(user_review_table.c.id < bindparam("before_id"))
+)
+_AVERAGE_RATING = cast(user_rating_stats_table.c.sum_rating, Float) / func.nullif(
+    user_rating_stats_table.c.review_count, literal_column("0"), type_=Float
+)
+_SELECT_AVERAGE_RATING = PreparedQuery(
+    select(_AVERAGE_RATING).where(
+        user_rating_stats_table.c.user_id == bindparam("user_id")
+    )
+)
+_USER_IDS = bindparam("user_ids", type_=ARRAY(PG_UUID(as_uuid=True)))
+_SELECT_SENT_BY_USER_IDS = PreparedQuery(
+    select(user_review_table).where(user_review_table.c.reviewer_id == any_(_USER_IDS))
+)
+_SELECT_RECEIVED_BY_USER_IDS = PreparedQuery(
+    select(user_review_table).where(
+        user_review_table.c.reviewed_user_id == any_(_USER_IDS)
+    )
+)
+_SELECT_AVERAGE_RATINGS = PreparedQuery(
+    select(
+        user_rating_stats_table.c.user_id, _AVERAGE_RATING.label("avg_rating")
+    ).where(user_rating_stats_table.c.user_id == any_(_USER_IDS))
+)
 
 
 class UserReviewRepository(IUserReviewRepository):
     """A class implementing the user review repository."""
 
-    async def get_all_user_reviews(self) -> Iterable[UserReview]:
-        """The method getting all user reviews from the database.
+    async def get_all_user_reviews(self) -> AsyncIterator[UserReview]:
+        """The method streaming all user reviews from the database.
 
-        Returns:
-            Iterable[UserReview]: The collection of all user reviews.
+        Yields:
+            UserReview: The consecutive user reviews.
         """
-        query = select(user_review_table)
-        reviews = await database.fetch_all(query)
-        return [UserReview(**dict(review)) for review in reviews]
+        async for review in _SELECT_ALL.iterate():
+            yield UserReview.model_construct(**review)
 
     async def get_user_review_by_id(self, user_review_id: int) -> UserReview | None:
         """The method getting an user review from the database based on provided id.
@@ -37,54 +113,119 @@ class UserReviewRepository(IUserReviewRepository):
         return UserReview(**dict(review)) if review else None
 
     async def get_sent_reviews_for_user_id(
-        self, user_id: UUID4
+        self, user_id: UUID
     ) -> Iterable[UserReview]:
         """The method getting all user reviews sent by provided user id from the database.
 
         Args:
-            user_id (UUID4): The UUID of the user
+            user_id (UUID): The UUID of the user
 
         Returns:
             Iterable[UserReview] | None: The collection of the all user reviews sent by provided user if exists.
         """
-        query = select(user_review_table).where(
-            user_review_table.c.reviewer_id == user_id
-        )
+        query = _SELECT_SENT.params(user_id=user_id)
         reviews = await database.fetch_all(query)
         return [UserReview(**dict(review)) for review in reviews]
 
     async def get_received_reviews_for_user_id(
-        self, user_id: UUID4
+        self, user_id: UUID
     ) -> Iterable[UserReview]:
         """The method getting all user reviews received by provided user id from the database.
 
         Args:
-            user_id (UUID4): The UUID of the user
+            user_id (UUID): The UUID of the user
 
         Returns:
             Iterable[UserReview] | None: The collection of the all user reviews received by provided user if exists.
         """
-        query = select(user_review_table).where(
-            user_review_table.c.reviewed_user_id == user_id
-        )
+        query = _SELECT_RECEIVED.params(user_id=user_id)
         reviews = await database.fetch_all(query)
         return [UserReview(**dict(review)) for review in reviews]
 
-    async def get_average_rating_for_user(self, user_id: UUID4) -> float | None:
+    async def get_received_reviews_page(
+        self, user_id: UUID, before_id: int | None, limit: int
+    ) -> Iterable[UserReview]:
+        """The method getting a page of user reviews received by the user.
+
+        Pages are cut by the id of the last seen review, so each page is
+        an index range scan regardless of how deep the client has paged.
+
+        Args:
+            user_id (UUID): The UUID of the user.
+            before_id (int | None): The id of the last review of the previous
+                page, None for the first page.
+            limit (int): The maximum number of reviews in the page.
+
+        Returns:
+            Iterable[UserReview]: The user reviews, newest first.
+        """
+        if before_id is None:
+            reviews = await _SELECT_RECEIVED_FIRST_PAGE.fetch_all(
+                user_id=user_id, limit=limit
+            )
+        else:
+            reviews = await _SELECT_RECEIVED_NEXT_PAGE.fetch_all(
+                user_id=user_id, before_id=before_id, limit=limit
+            )
+        return [UserReview.model_construct(**review) for review in reviews]
+
+    async def get_average_rating_for_user(self, user_id: UUID) -> float | None:
         """The method getting average rating for user from the database based on provided user id.
 
+        The rating is read from the running sum and count kept per user,
+        so it costs a single primary key lookup.
+
         Args:
-            user_id (UUID4): The id of the user
+            user_id (UUID): The id of the user
 
         Returns:
             float | None: The average rating if exists.
         """
-        query = select(func.avg(user_review_table.c.rating)).where(
-            user_review_table.c.reviewed_user_id == user_id
-        )
-        result = await database.fetch_val(query)
+        result = await _SELECT_AVERAGE_RATING.fetch_val(user_id=user_id)
         return float(result) if result is not None else None
 
+    async def get_sent_reviews_for_user_ids(
+        self, user_ids: list[UUID]
+    ) -> dict[UUID, list[UserReview]]:
+        """The method getting user reviews sent by many users with one query.
+
+        Args:
+            user_ids (list[UUID]): The UUIDs of the users.
+
+        Returns:
+            dict[UUID, list[UserReview]]: The reviews grouped by reviewer UUID.
+        """
+        reviews = await _SELECT_SENT_BY_USER_IDS.fetch_all(user_ids=user_ids)
+        return _group_by_key(reviews, "reviewer_id")
+
+    async def get_received_reviews_for_user_ids(
+        self, user_ids: list[UUID]
+    ) -> dict[UUID, list[UserReview]]:
+        """The method getting user reviews received by many users with one query.
+
+        Args:
+            user_ids (list[UUID]): The UUIDs of the users.
+
+        Returns:
+            dict[UUID, list[UserReview]]: The reviews grouped by reviewed user UUID.
+        """
+        reviews = await _SELECT_RECEIVED_BY_USER_IDS.fetch_all(user_ids=user_ids)
+        return _group_by_key(reviews, "reviewed_user_id")
+
+    async def get_average_ratings_for_users(
+        self, user_ids: list[UUID]
+    ) -> dict[UUID, float | None]:
+        """The method getting average ratings of many users with one query.
+
+        Args:
+            user_ids (list[UUID]): The UUIDs of the users.
+
+        Returns:
+            dict[UUID, float | None]: The average ratings by user UUID.
+        """
+        ratings = await _SELECT_AVERAGE_RATINGS.fetch_all(user_ids=user_ids)
+        return {rating["user_id"]: rating["avg_rating"] for rating in ratings}
+
     async def add_user_review(self, data: UserReviewIn) -> UserReview | None:
         """The method adding new user review to the database.
 
@@ -99,6 +240,30 @@ class UserReviewRepository(IUserReviewRepository):
         new_user_review = await self._get_by_id(new_user_review_id)
         return UserReview(**dict(new_user_review)) if new_user_review else None
 
+    async def add_user_reviews_bulk(
+        self, data: list[UserReviewIn]
+    ) -> Iterable[UserReview]:
+        """The method adding many user reviews to the database at once.
+
+        All rows are sent as a single multi-row INSERT ... RETURNING statement.
+
+        Args:
+            data (list[UserReviewIn]): The attributes of the user reviews.
+
+        Returns:
+            Iterable[UserReview]: The collection of the newly created user reviews.
+        """
+        if not data:
+            return []
+
+        query = (
+            insert(user_review_table)
+            .values([review.model_dump() for review in data])
+            .returning(user_review_table)
+        )
+        reviews = await database.fetch_all(query)
+        return [UserReview(**dict(review)) for review in reviews]
+
     async def delete_user_review(self, user_review_id: int) -> bool:
         """The method removing user review from the database.
 
@@ -125,7 +290,4 @@ class UserReviewRepository(IUserReviewRepository):
         Returns:
             Record | None: The user review record if exists.
         """
-        query = select(user_review_table).where(
-            user_review_table.c.id == user_review_id
-        )
-        return await database.fetch_one(query)
+        return await _SELECT_BY_ID.fetch_one(user_review_id=user_review_id)
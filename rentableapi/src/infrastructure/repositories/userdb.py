@@ -1,14 +1,25 @@
 """A repository for user entity."""
 
-from typing import Any
+import asyncio
+from typing import Any, AsyncIterator
+from uuid import UUID
 
-from pydantic import UUID4
+from sqlalchemy import bindparam, exists, select
 
-from src.core.domain.user import UserIn
+from src.core.domain.user import User, UserIn
 from src.core.repositories.iuser import IUserRepository
-from src.db import database, user_table
+from src.db import BatchedQuery, database, user_table
 from src.infrastructure.utils.password import hash_password
 
+_SELECT_ALL = BatchedQuery(select(user_table), user_table.c.id)
+_SELECT_BY_UUID = select(user_table).where(user_table.c.id == bindparam("uuid"))
+_SELECT_BY_EMAIL = select(user_table).where(
+    user_table.c.email == bindparam("email")
+)
+_SELECT_EMAIL_EXISTS = select(
+    exists().where(user_table.c.email == bindparam("email"))
+)
+
 
 class UserRepository(IUserRepository):
     """An implementation of repository class for user."""
@@ -23,27 +34,27 @@ class UserRepository(IUserRepository):
             Any | None: The new user object.
         """
 
-        if await self.get_by_email(user.email):
+        if await self.email_exists(user.email):
             return None
 
-        user.password = hash_password(user.password)
+        user.password = await asyncio.to_thread(hash_password, user.password)
 
         query = user_table.insert().values(**user.model_dump())
         new_user_uuid = await database.execute(query)
 
         return await self.get_by_uuid(new_user_uuid)
 
-    async def get_by_uuid(self, uuid: UUID4) -> Any | None:
+    async def get_by_uuid(self, uuid: UUID) -> Any | None:
         """A method getting user by UUID.
 
         Args:
-            uuid (UUID4): UUID of the user.
+            uuid (UUID): UUID of the user.
 
         Returns:
             Any | None: The user object if exists.
         """
 
-        query = user_table.select().where(user_table.c.id == uuid)
+        query = _SELECT_BY_UUID.params(uuid=uuid)
         user = await database.fetch_one(query)
 
         return user
@@ -58,19 +69,30 @@ class UserRepository(IUserRepository):
             Any | None: The user object if exists.
         """
 
-        query = user_table.select().where(user_table.c.email == email)
+        query = _SELECT_BY_EMAIL.params(email=email)
         user = await database.fetch_one(query)
 
         return user
 
-    async def get_all_users(self) -> Any:
-        """A method getting all users.
+    async def email_exists(self, email: str) -> bool:
+        """A method checking if user with provided email exists.
+
+        Args:
+            email (str): The email of the user.
 
         Returns:
-            Any: The list of all users.
+            bool: True if the email is already registered, False otherwise.
         """
 
-        query = user_table.select()
-        users = await database.fetch_all(query)
+        query = _SELECT_EMAIL_EXISTS.params(email=email)
 
-        return users
+        return bool(await database.fetch_val(query))
+
+    async def get_all_users(self) -> AsyncIterator[User]:
+        """A method streaming all users.
+
+        Yields:
+            User: The consecutive users.
+        """
+        async for user in _SELECT_ALL.iterate():
+            yield User.model_construct(**user)
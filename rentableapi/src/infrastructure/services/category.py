@@ -5,19 +5,24 @@ from typing import Iterable
 from src.core.domain.category import Category, CategoryIn
 from src.core.repositories.icategory import ICategoryRepository
 from src.infrastructure.services.icategory import ICategoryService
+from src.infrastructure.utils.cache import TTLCache
+from src.infrastructure.utils.consts import ALL_CATEGORIES_RESPONSE_KEY
 
 class CategoryService(ICategoryService):
     """A class implementing the category service."""
 
     _repository: ICategoryRepository
+    _cache: TTLCache
 
-    def __init__(self, repository: ICategoryRepository) -> None:
+    def __init__(self, repository: ICategoryRepository, cache: TTLCache) -> None:
         """The initializer of the category service.
         
         Args:
             repository (ICategoryRepository): The reference to the repository.
+            cache (TTLCache): The reference to the shared cache.
         """
         self._repository = repository
+        self._cache = cache
     
     async def get_category_by_id(self, category_id: int) -> Category | None:
         """The method getting a category from the repository.
@@ -47,7 +52,9 @@ class CategoryService(ICategoryService):
         Returns:
             Category | None: The newly created category.
         """
-        return await self._repository.add_category(data)
+        new_category = await self._repository.add_category(data)
+        self._cache.delete(ALL_CATEGORIES_RESPONSE_KEY)
+        return new_category
 
     async def update_category(self, category_id: int, data: CategoryIn) -> Category | None:
         """The method updating category data in the repository.
@@ -59,7 +66,11 @@ class CategoryService(ICategoryService):
         Returns:
             Category | None: The updated category.
         """
-        return await self._repository.update_category(category_id=category_id, data=data)
+        updated_category = await self._repository.update_category(
+            category_id=category_id, data=data
+        )
+        self._cache.delete(ALL_CATEGORIES_RESPONSE_KEY)
+        return updated_category
     
     async def delete_category(self, category_id: int) -> bool:
         """The method deleting category from the repository.
@@ -70,4 +81,6 @@ class CategoryService(ICategoryService):
         Returns:
             bool: The success of the operation.
         """
-        return await self._repository.delete_category(category_id)
\ No newline at end of file
+        is_deleted = await self._repository.delete_category(category_id)
+        self._cache.delete(ALL_CATEGORIES_RESPONSE_KEY)
+        return is_deleted
\ No newline at end of file
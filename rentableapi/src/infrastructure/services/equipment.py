@@ -1,33 +1,50 @@
 """Module containing subcategory service implementation."""
 
-from typing import Iterable
+import asyncio
+from typing import Any, Iterable, Mapping
 
 from fastapi import HTTPException
 
-from src.core.domain.equipment import Equipment, EquipmentIn
+from src.core.domain.equipment import Equipment, EquipmentDetails, EquipmentIn
 from src.core.repositories.iequipment import IEquipmentRepository
+from src.core.repositories.iequipment_review import IEquipmentReviewRepository
 from src.core.repositories.iuser import IUserRepository
 from src.infrastructure.services.iequipment import IEquipmentService
+from src.infrastructure.utils.cache import TTLCache
+from src.infrastructure.utils.consts import (
+    ALL_EQUIPMENT_RESPONSE_KEY,
+    EQUIPMENT_RESPONSE_KEY_PREFIX,
+)
+from src.infrastructure.utils.ratings import average_rating
 
 class EquipmentService(IEquipmentService):
     """A class implementing the equipment service."""
 
     _repository: IEquipmentRepository
     _user_repository: IUserRepository
+    _equipment_review_repository: IEquipmentReviewRepository
+    _cache: TTLCache
 
     def __init__(
         self, 
         repository: IEquipmentRepository,
-        user_repository: IUserRepository
+        user_repository: IUserRepository,
+        equipment_review_repository: IEquipmentReviewRepository,
+        cache: TTLCache,
     ) -> None:
         """The initializer of the subcategory service.
         
         Args:
             repository (IEquipmentRepository): The reference to the repository.
             user_repository (IUserRepository): The reference to the user repository.
+            equipment_review_repository (IEquipmentReviewRepository): The reference
+                to the equipment review repository.
+            cache (TTLCache): The reference to the shared cache.
         """
         self._repository = repository
         self._user_repository = user_repository
+        self._equipment_review_repository = equipment_review_repository
+        self._cache = cache
     
     async def get_equipment_by_id(self, equipment_id: int) -> Equipment | None:
         """The method getting a equipment from the repository.
@@ -40,6 +57,36 @@ class EquipmentService(IEquipmentService):
         """
         return await self._repository.get_equipment_by_id(equipment_id)
 
+    async def get_equipment_details(
+        self, equipment_id: int
+    ) -> EquipmentDetails | None:
+        """The method getting a equipment together with its reviews.
+
+        The equipment and its reviews are fetched concurrently; the average
+        rating is computed from the fetched reviews, saving a third query.
+
+        Args:
+            equipment_id (int): The id of the equipment.
+
+        Returns:
+            EquipmentDetails | None: The equipment details if exists.
+        """
+        equipment, reviews = await asyncio.gather(
+            self._repository.get_equipment_by_id(equipment_id),
+            self._equipment_review_repository.get_reviews_by_equipment_id(
+                equipment_id
+            ),
+        )
+        if not equipment:
+            return None
+
+        reviews = list(reviews)
+        return EquipmentDetails(
+            **equipment.model_dump(),
+            average_rating=average_rating(review.rating for review in reviews),
+            reviews=reviews,
+        )
+
     async def get_all_equipments(self) -> Iterable[Equipment]:
         """The method getting all equipments from the repository.
 
@@ -48,6 +95,14 @@ class EquipmentService(IEquipmentService):
         """
         return await self._repository.get_all_equipments()
 
+    async def get_all_equipments_raw(self) -> Iterable[Mapping[str, Any]]:
+        """The method getting all equipment rows from the repository.
+
+        Returns:
+            Iterable[Mapping[str, Any]]: The rows of all equipments.
+        """
+        return await self._repository.get_all_equipments_raw()
+
     async def get_all_equipment_by_category_id(
         self, category_id: int
     ) -> Iterable[Equipment]:
@@ -88,7 +143,9 @@ class EquipmentService(IEquipmentService):
                 status_code=404,
                 detail="User not found",
             )
-        return await self._repository.add_equipment(data)
+        new_equipment = await self._repository.add_equipment(data)
+        self._cache.delete(ALL_EQUIPMENT_RESPONSE_KEY)
+        return new_equipment
 
     async def update_equipment(self, equipment_id: int, data: EquipmentIn) -> Equipment | None:
         """The method updating equipment data in the repository.
@@ -100,7 +157,10 @@ class EquipmentService(IEquipmentService):
         Returns:
             Equipment | None: The updated equipment.
         """
-        return await self._repository.update_equipment(equipment_id, data)
+        updated_equipment = await self._repository.update_equipment(equipment_id, data)
+        self._cache.delete(ALL_EQUIPMENT_RESPONSE_KEY)
+        self._cache.delete(f"{EQUIPMENT_RESPONSE_KEY_PREFIX}{equipment_id}")
+        return updated_equipment
 
     async def delete_equipment(self, equipment_id: int) -> bool:
         """The method deleting equipment from the repository.
@@ -111,4 +171,7 @@ class EquipmentService(IEquipmentService):
         Returns:
             bool: The success of the operation.
         """
-        return await self._repository.delete_equipment(equipment_id)
\ No newline at end of file
+        is_deleted = await self._repository.delete_equipment(equipment_id)
+        self._cache.delete(ALL_EQUIPMENT_RESPONSE_KEY)
+        self._cache.delete(f"{EQUIPMENT_RESPONSE_KEY_PREFIX}{equipment_id}")
+        return is_deleted
\ No newline at end of file
@@ -1,84 +1,120 @@
 """Module containing equipment review implementation."""
 
-from typing import Iterable
-
-from pydantic import UUID4
+import asyncio
 
 from src.core.domain.equipment_review import EquipmentReview, EquipmentReviewIn
 from src.core.repositories.iequipment_review import IEquipmentReviewRepository
 from src.infrastructure.services.iequipment_review import IEquipmentReviewService
+from src.infrastructure.utils.cache import TTLCache
+from src.infrastructure.utils.consts import (
+    ALL_EQUIPMENT_REVIEWS_RESPONSE_KEY,
+    EQUIPMENT_RATING_CACHE_TTL,
+    EQUIPMENT_RATING_KEY_PREFIX,
+)
+from src.infrastructure.utils.dataloader import DataLoader
+from src.infrastructure.utils.delegate import RepositoryDelegate
+
+
+def _average_rating_key(equipment_id: int) -> str:
+    """A function returning cache key of the equipment's average rating.
+
+    Args:
+        equipment_id (int): The equipment id.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"{EQUIPMENT_RATING_KEY_PREFIX}{equipment_id}"
 
 
 class EquipmentReviewService(IEquipmentReviewService):
-    """A class implementing the equipment review service."""
+    """A class implementing the equipment review service.
+
+    Its loader batches rating lookups across concurrent requests.
+    """
+
+    __slots__ = ("_repository", "_cache", "_average_loader")
 
     _repository: IEquipmentReviewRepository
+    _cache: TTLCache
+    _average_loader: DataLoader[int, float | None]
 
-    def __init__(self, repository: IEquipmentReviewRepository) -> None:
+    get_equipment_review_by_id = RepositoryDelegate()
+    get_all_equipment_reviews = RepositoryDelegate()
+    get_all_equipment_reviews_raw = RepositoryDelegate()
+    get_reviews_by_equipment_id = RepositoryDelegate()
+    get_reviews_by_reviewer_id = RepositoryDelegate()
+
+    def __init__(self, repository: IEquipmentReviewRepository, cache: TTLCache) -> None:
         """The initializer of the equipment review service.
 
         Args:
             repository (IEquipmentReviewRepository): The reference to the repository.
+            cache (TTLCache): The reference to the shared cache.
         """
         self._repository = repository
+        self._cache = cache
+        self._average_loader = DataLoader(
+            repository.get_average_ratings_for_equipments, lambda: None
+        )
 
-    async def get_equipment_review_by_id(
-        self, equipment_review_id: int
-    ) -> EquipmentReview | None:
-        """The method getting an equipment review from the repository.
+    async def get_reviews_by_equipment_ids(
+        self, equipment_ids: list[int]
+    ) -> dict[int, list[EquipmentReview]]:
+        """The method getting equipment reviews for many equipments at once.
 
         Args:
-            equipment_review_id (int): The id of the equipment review.
+            equipment_ids (list[int]): The ids of the equipments.
 
         Returns:
-            EquipmentReview | None: The equipment review data if exists.
+            dict[int, list[EquipmentReview]]: The reviews grouped by equipment id.
         """
-        return await self._repository.get_equipment_review_by_id(equipment_review_id)
-
-    async def get_all_equipment_reviews(self) -> Iterable[EquipmentReview]:
-        """The method getting all equipment reviews from the repository.
+        reviews = await self._repository.get_reviews_by_equipment_ids(equipment_ids)
+        return {
+            equipment_id: reviews.get(equipment_id, [])
+            for equipment_id in equipment_ids
+        }
 
-        Returns:
-            Iterable[EquipmentReview]: The collection of all equipment reviews.
-        """
-        return await self._repository.get_all_equipment_reviews()
+    async def get_average_rating_for_equipment(self, equipment_id: int) -> float | None:
+        """The method getting average rating for equipment from the repository.
 
-    async def get_reviews_by_equipment_id(
-        self, equipment_id: int
-    ) -> Iterable[EquipmentReview]:
-        """The method getting all equipment reviews from the repository.
+        The rating is cached per equipment and dropped whenever a review of
+        the equipment is added or deleted. Misses of concurrent lookups are
+        fetched together with one query.
 
         Args:
             equipment_id (int): The equipment id.
 
         Returns:
-            Iterable[EquipmentReview]: The collection of all equipment reviews.
+            float | None: The average rating for equipment.
         """
-        return await self._repository.get_reviews_by_equipment_id(equipment_id)
-
-    async def get_reviews_by_reviewer_id(
-        self, reviewer_id: UUID4
-    ) -> Iterable[EquipmentReview]:
-        """The method getting all equipment reviews from the repository.
+        return await self._cache.get_or_load(
+            _average_rating_key(equipment_id),
+            lambda: self._average_loader.load(equipment_id),
+            ttl=EQUIPMENT_RATING_CACHE_TTL,
+        )
 
-        Args:
-            reviewer_id (UUID4): The reviewer id.
-
-        Returns:
-            Iterable[EquipmentReview]: The collection of all equipment reviews.
-        """
-        return await self._repository.get_reviews_by_reviewer_id(reviewer_id)
+    async def get_average_ratings_for_equipments(
+        self, equipment_ids: list[int]
+    ) -> dict[int, float | None]:
+        """The method getting average ratings for many equipments at once.
 
-    async def get_average_rating_for_equipment(self, equipment_id: int) -> float | None:
-        """The method getting average rating for equipment from the repository.
+        Cached ratings are served from the cache, the misses are fetched
+        from the repository with a single query.
 
         Args:
-            equipment_id (int): The equipment id.
+            equipment_ids (list[int]): The ids of the equipments.
 
         Returns:
-            float | None: The average rating for equipment.
+            dict[int, float | None]: The average ratings by equipment id.
         """
-        return await self._repository.get_average_rating_for_equipment(equipment_id)
+        ratings = await asyncio.gather(
+            *(
+                self.get_average_rating_for_equipment(equipment_id)
+                for equipment_id in equipment_ids
+            )
+        )
+        return dict(zip(equipment_ids, ratings))
 
     async def add_equipment_review(
         self, data: EquipmentReviewIn
@@ -91,7 +127,10 @@ class EquipmentReviewService(IEquipmentReviewService):
         Returns:
             EquipmentReview | None: The newly created equipment review.
         """
-        return await self._repository.add_equipment_review(data)
+        new_review = await self._repository.add_equipment_review(data)
+        self._cache.delete(ALL_EQUIPMENT_REVIEWS_RESPONSE_KEY)
+        self._cache.delete(_average_rating_key(data.equipment_id))
+        return new_review
 
     async def delete_equipment_review(self, equipment_review_id: int) -> bool:
         """The method deleting equipment review from the repository.
@@ -102,4 +141,10 @@ class EquipmentReviewService(IEquipmentReviewService):
         Returns:
             bool: The success of the operation.
         """
-        return await self._repository.delete_equipment_review(equipment_review_id)
+        review = await self._repository.delete_equipment_review(equipment_review_id)
+        if not review:
+            return False
+
+        self._cache.delete(ALL_EQUIPMENT_REVIEWS_RESPONSE_KEY)
+        self._cache.delete(_average_rating_key(review.equipment_id))
+        return True
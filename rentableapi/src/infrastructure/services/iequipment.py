@@ -1,9 +1,9 @@
 """Module containing equipment service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Any, Iterable, Mapping
 
-from src.core.domain.equipment import Equipment, EquipmentIn
+from src.core.domain.equipment import Equipment, EquipmentDetails, EquipmentIn
 
 class IEquipmentService(ABC):
     """An abstract class representing protocol of equipment service."""
@@ -17,6 +17,19 @@ class IEquipmentService(ABC):
         Returns:
             Equipment | None: The equipment data if exists.
         """
+
+    @abstractmethod
+    async def get_equipment_details(
+        self, equipment_id: int
+    ) -> EquipmentDetails | None:
+        """The method getting a equipment together with its reviews.
+
+        Args:
+            equipment_id (int): The id of the equipment.
+
+        Returns:
+            EquipmentDetails | None: The equipment details if exists.
+        """
     
     @abstractmethod
     async def get_all_equipments(self) -> Iterable[Equipment]:
@@ -26,6 +39,14 @@ class IEquipmentService(ABC):
             Iterable[Equipment]: The collection of the all equipments.
         """
 
+    @abstractmethod
+    async def get_all_equipments_raw(self) -> Iterable[Mapping[str, Any]]:
+        """The method getting all equipment rows from the repository.
+
+        Returns:
+            Iterable[Mapping[str, Any]]: The rows of all equipments.
+        """
+
     @abstractmethod
     async def get_all_equipment_by_category_id(
         self, category_id: int
@@ -1,14 +1,16 @@
 """Module containing equipment review service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
-
-from pydantic import UUID4
+from typing import Any, AsyncIterator, Iterable, Mapping
+from uuid import UUID
 
 from src.core.domain.equipment_review import EquipmentReview, EquipmentReviewIn
 
 class IEquipmentReviewService(ABC):
     """An abstract class representing protocol of equipment review service."""
+
+    __slots__ = ()
+
     @abstractmethod
     async def get_equipment_review_by_id(self, equipment_review_id: int) -> EquipmentReview | None:
         """The method getting an equipment review from the repository.
@@ -21,11 +23,19 @@ class IEquipmentReviewService(ABC):
         """
     
     @abstractmethod
-    async def get_all_equipment_reviews(self) -> Iterable[EquipmentReview]:
-        """The method getting all equipment reviews from the repository.
+    def get_all_equipment_reviews(self) -> AsyncIterator[EquipmentReview]:
+        """The method streaming all equipment reviews from the repository.
 
         Returns:
-            Iterable[EquipmentReview]: The collection of all equipment reviews.
+            AsyncIterator[EquipmentReview]: The all equipment reviews.
+        """
+
+    @abstractmethod
+    def get_all_equipment_reviews_raw(self) -> AsyncIterator[Mapping[str, Any]]:
+        """The method streaming all equipment review rows from the repository.
+
+        Returns:
+            AsyncIterator[Mapping[str, Any]]: The rows of all equipment reviews.
         """
 
     @abstractmethod
@@ -41,14 +51,27 @@ class IEquipmentReviewService(ABC):
             Iterable[EquipmentReview] | None: The collection of all equipment reviews if exists.
         """
 
+    @abstractmethod
+    async def get_reviews_by_equipment_ids(
+        self, equipment_ids: list[int]
+    ) -> dict[int, list[EquipmentReview]]:
+        """The method getting equipment reviews for many equipments at once.
+
+        Args:
+            equipment_ids (list[int]): The ids of the equipments.
+
+        Returns:
+            dict[int, list[EquipmentReview]]: The reviews grouped by equipment id.
+        """
+
     @abstractmethod
     async def get_reviews_by_reviewer_id(
-        self, reviewer_id: UUID4
+        self, reviewer_id: UUID
     ) -> Iterable[EquipmentReview] | None:
         """The method getting all equipment reviews from the repository based on provided reviewer id.
 
         Args:
-            reviewer_id (UUID4): The UUID of the reviewer
+            reviewer_id (UUID): The UUID of the reviewer
 
         Returns:
             Iterable[EquipmentReview] | None: The collection of all equipment reviews if exists.
@@ -65,6 +88,19 @@ class IEquipmentReviewService(ABC):
             float | None: The average rating if exists.
         """
 
+    @abstractmethod
+    async def get_average_ratings_for_equipments(
+        self, equipment_ids: list[int]
+    ) -> dict[int, float | None]:
+        """The method getting average ratings for many equipments at once.
+
+        Args:
+            equipment_ids (list[int]): The ids of the equipments.
+
+        Returns:
+            dict[int, float | None]: The average ratings by equipment id.
+        """
+
     @abstractmethod
     async def add_equipment_review(self, data: EquipmentReviewIn) -> EquipmentReview | None:
         """The method adding new equipment review to the repository.
@@ -1,17 +1,22 @@
 """Module containing reservation service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Any, AsyncIterator, Iterable, Mapping
 from datetime import date
+from uuid import UUID
 
-from pydantic import UUID4
-
-from src.core.domain.reservation import Reservation, ReservationIn
+from src.core.domain.reservation import (
+    Reservation,
+    ReservationDashboard,
+    ReservationIn,
+)
 
 
 class IReservationService(ABC):
     """An abstract class representing protocol of reservation service."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def get_reservation_by_id(self, reservation_id: int) -> Reservation | None:
         """The abstract getting a reservation from the repository.
@@ -24,21 +29,29 @@ class IReservationService(ABC):
         """
 
     @abstractmethod
-    async def get_all_reservations(self) -> Iterable[Reservation]:
-        """The abstract getting all reservations from the repository.
+    def get_all_reservations(self) -> AsyncIterator[Reservation]:
+        """The abstract streaming all reservations from the repository.
 
         Returns:
-            Iterable[Reservation]: The collection of the all reservations.
+            AsyncIterator[Reservation]: The all reservations.
+        """
+
+    @abstractmethod
+    def get_all_reservations_raw(self) -> AsyncIterator[Mapping[str, Any]]:
+        """The abstract streaming all reservation rows from the repository.
+
+        Returns:
+            AsyncIterator[Mapping[str, Any]]: The rows of all reservations.
         """
 
     @abstractmethod
     async def get_all_reservations_by_user(
-        self, user_id: UUID4
+        self, user_id: UUID
     ) -> Iterable[Reservation]:
         """The method getting all reservations from the repository based on its user ID.
 
         Args:
-            user_id (UUID4): The UUID of the user.
+            user_id (UUID): The UUID of the user.
 
         Returns:
             Iterable[Reservation]: The collection of the all reservations.
@@ -94,6 +107,19 @@ class IReservationService(ABC):
             Reservation | None: The newly created reservation.
         """
 
+    @abstractmethod
+    async def add_reservations_bulk(
+        self, data: list[ReservationIn]
+    ) -> Iterable[Reservation]:
+        """The abstract adding many reservations to the repository at once.
+
+        Args:
+            data (list[ReservationIn]): The attributes of the reservations.
+
+        Returns:
+            Iterable[Reservation]: The collection of the newly created reservations.
+        """
+
     @abstractmethod
     async def update_reservation(
         self, reservation_id: int, data: ReservationIn
@@ -120,14 +146,30 @@ class IReservationService(ABC):
         """
 
     @abstractmethod
-    async def get_most_rented_equipment_ids(self, limit: int) -> Iterable[dict]:
+    async def get_most_rented_equipment_ids(
+        self, limit: int
+    ) -> tuple[list[int], list[int]]:
         """The method getting most rented equipment IDs from the repository.
 
         Args:
             limit (int): The limit of the most rented equipment IDs.
 
         Returns:
-            Iterable[dict]: The collection of the most rented equipment IDs with their finished reservation count.
+            tuple[list[int], list[int]]: The equipment IDs and their finished reservation counts.
+        """
+
+    @abstractmethod
+    async def get_user_dashboard(
+        self, user_id: UUID, limit: int
+    ) -> ReservationDashboard:
+        """The method getting user's reservations with most rented equipment.
+
+        Args:
+            user_id (UUID): The id of the user.
+            limit (int): The limit of the most rented equipment IDs.
+
+        Returns:
+            ReservationDashboard: The user's reservations and most rented equipment.
         """
 
     @abstractmethod
@@ -9,6 +9,8 @@ from src.core.domain.subcategory import Subcategory, SubcategoryIn
 class ISubcategoryService(ABC):
     """An abstract class representing protocol of subcategory service."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def get_subcategory_by_id(self, subcategory_id: int) -> Subcategory | None:
         """The method getting a subcategory from the repository.
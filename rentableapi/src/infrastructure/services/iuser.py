@@ -1,9 +1,8 @@
 """Module containing user service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
-
-from pydantic import UUID4
+from typing import AsyncIterator
+from uuid import UUID
 
 from src.core.domain.user import User, UserIn
 from src.infrastructure.dto.tokendto import TokenDTO
@@ -36,19 +35,19 @@ class IUserService(ABC):
         """
 
     @abstractmethod
-    async def get_all_users(self) -> Iterable[User]:
-        """The method getting all registered users.
+    def get_all_users(self) -> AsyncIterator[User]:
+        """The method streaming all registered users.
 
         Returns:
-            Iterable[User]: The collection of all registered users
+            AsyncIterator[User]: The all registered users
         """
 
     @abstractmethod
-    async def get_user_by_uuid(self, uuid: UUID4) -> UserDTO | None:
+    async def get_user_by_uuid(self, uuid: UUID) -> UserDTO | None:
         """The method getting user by UUID.
 
         Args:
-            uuid (UUID4): The UUID of the user.
+            uuid (UUID): The UUID of the user.
 
         Returns:
             UserDTO | None: The user data if exists.
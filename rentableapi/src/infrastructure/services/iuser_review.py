@@ -1,9 +1,8 @@
 """Module containing user review service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
-
-from pydantic import UUID4
+from typing import AsyncIterator, Iterable
+from uuid import UUID
 
 from src.core.domain.user_review import UserReview, UserReviewIn
 
@@ -11,12 +10,14 @@ from src.core.domain.user_review import UserReview, UserReviewIn
 class IUserReviewService(ABC):
     """The abstract class representing protocol of user reviews service."""
 
+    __slots__ = ()
+
     @abstractmethod
-    async def get_all_user_reviews(self) -> Iterable[UserReview]:
-        """The abstract method getting all user reviews.
+    def get_all_user_reviews(self) -> AsyncIterator[UserReview]:
+        """The abstract method streaming all user reviews.
 
         Returns:
-            Iterable[UserReview]: User reviews.
+            AsyncIterator[UserReview]: User reviews.
         """
 
     @abstractmethod
@@ -32,12 +33,12 @@ class IUserReviewService(ABC):
 
     @abstractmethod
     async def get_sent_reviews_for_user_id(
-        self, user_id: UUID4
+        self, user_id: UUID
     ) -> Iterable[UserReview] | None:
         """The abstract method getting all user reviews sent by provided user id.
 
         Args:
-            user_id (UUID4): The id of the user.
+            user_id (UUID): The id of the user.
 
         Returns:
             Iterable[UserReview]: The collection of the all user reviews sent by provided user.
@@ -45,23 +46,39 @@ class IUserReviewService(ABC):
 
     @abstractmethod
     async def get_received_reviews_for_user_id(
-        self, user_id: UUID4
+        self, user_id: UUID
     ) -> Iterable[UserReview] | None:
         """The abstract method getting all user reviews received by provided user id.
 
         Args:
-            user_id (UUID4): The id of the user.
+            user_id (UUID): The id of the user.
 
         Returns:
             Iterable[UserReview]: The collection of the all user reviews received by provided user.
         """
 
     @abstractmethod
-    async def get_average_rating_for_user(self, user_id: UUID4) -> float | None:
+    async def get_received_reviews_page(
+        self, user_id: UUID, before_id: int | None, limit: int
+    ) -> Iterable[UserReview]:
+        """The abstract method getting a page of user reviews received by the user.
+
+        Args:
+            user_id (UUID): The id of the user.
+            before_id (int | None): The id of the last review of the previous
+                page, None for the first page.
+            limit (int): The maximum number of reviews in the page.
+
+        Returns:
+            Iterable[UserReview]: The user reviews, newest first.
+        """
+
+    @abstractmethod
+    async def get_average_rating_for_user(self, user_id: UUID) -> float | None:
         """The abstract method getting average rating for the user by provided user id.
 
         Args:
-            user_id (UUID4): The id of the user.
+            user_id (UUID): The id of the user.
 
         Returns:
             float | None: The average rating for the user.
@@ -78,6 +95,19 @@ class IUserReviewService(ABC):
             UserReview | None: The newly created user review.
         """
 
+    @abstractmethod
+    async def add_user_reviews_bulk(
+        self, data: list[UserReviewIn]
+    ) -> Iterable[UserReview]:
+        """The abstract method adding many user reviews at once.
+
+        Args:
+            data (list[UserReviewIn]): The details of the new user reviews.
+
+        Returns:
+            Iterable[UserReview]: The collection of the newly created user reviews.
+        """
+
     @abstractmethod
     async def delete_user_review(self, user_review_id: int) -> bool:
         """The abstract method remmoving user review.
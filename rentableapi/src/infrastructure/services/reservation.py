@@ -1,59 +1,88 @@
 """Module containing reservation service implementation."""
 
+import asyncio
 from typing import Iterable
-
-from pydantic import UUID4
-from datetime import date
-
-from src.core.domain.reservation import Reservation, ReservationIn
+from uuid import UUID
+
+from src.core.domain.reservation import (
+    MostRentedEquipment,
+    Reservation,
+    ReservationDashboard,
+    ReservationIn,
+)
 from src.core.repositories.ireservation import IReservationRepository
 from src.infrastructure.services.ireservation import IReservationService
+from src.infrastructure.utils.cache import TTLCache
+from src.infrastructure.utils.consts import (
+    ALL_RESERVATIONS_RESPONSE_KEY,
+    MOST_RENTED_CACHE_TTL,
+    MOST_RENTED_KEY_PREFIX,
+)
+from src.infrastructure.utils.dataloader import DataLoader
+from src.infrastructure.utils.delegate import RepositoryDelegate
+
+_FINISHED = "finished"
 
 
 class ReservationService(IReservationService):
-    """A class implementing the reservation service."""
+    """A class implementing the reservation service.
 
-    _repository: IReservationRepository
+    Its loaders batch lookups across concurrent requests.
+    """
+
+    __slots__ = (
+        "_repository",
+        "_cache",
+        "_user_loader",
+        "_equipment_loader",
+        "_category_loader",
+        "_subcategory_loader",
+    )
 
-    def __init__(self, repository: IReservationRepository) -> None:
+    _repository: IReservationRepository
+    _cache: TTLCache
+    _user_loader: DataLoader[UUID, list[Reservation]]
+    _equipment_loader: DataLoader[int, list[Reservation]]
+    _category_loader: DataLoader[int, list[Reservation]]
+    _subcategory_loader: DataLoader[int, list[Reservation]]
+
+    get_reservation_by_id = RepositoryDelegate()
+    get_all_reservations = RepositoryDelegate()
+    get_all_reservations_raw = RepositoryDelegate()
+    calculate_total_price = RepositoryDelegate()
+
+    def __init__(self, repository: IReservationRepository, cache: TTLCache) -> None:
         """The initializer of the reservation service.
 
         Args:
             repository (IReservationRepository): The reference to the repository.
+            cache (TTLCache): The reference to the shared cache.
         """
         self._repository = repository
-
-    async def get_reservation_by_id(self, reservation_id: int) -> Reservation | None:
-        """The method getting a reservation from the repository.
-
-        Args:
-            reservation_id (int): The id of the reservation.
-
-        Returns:
-            Reservation | None: The reservation data if exists.
-        """
-        return await self._repository.get_reservation_by_id(reservation_id)
-
-    async def get_all_reservations(self) -> Iterable[Reservation]:
-        """The method getting all reservations from the repository.
-
-        Returns:
-            Iterable[Reservation]: The collection of the all reservations.
-        """
-        return await self._repository.get_all_reservations()
+        self._cache = cache
+        self._user_loader = DataLoader(repository.get_reservations_for_user_ids, list)
+        self._equipment_loader = DataLoader(
+            repository.get_reservations_for_equipment_ids, list
+        )
+        self._category_loader = DataLoader(
+            repository.get_reservations_for_category_ids, list
+        )
+        self._subcategory_loader = DataLoader(
+            repository.get_reservations_for_subcategory_ids, list
+        )
 
     async def get_all_reservations_by_user(
-        self, user_id: UUID4
+        self, user_id: UUID
     ) -> Iterable[Reservation] | None:
         """The method getting all reservations by user from the repository.
 
         Args:
-            user_id (UUID4): The id of the user.
+            user_id (UUID): The id of the user.
 
         Returns:
             Iterable[Reservation] | None: The collection of the reservations if exists.
         """
-        return await self._repository.get_all_reservations_by_user(user_id)
+        return await self._user_loader.load(user_id)
 
     async def get_all_reservations_by_equipment_id(
         self, equipment_id: int
@@ -66,7 +95,7 @@ class ReservationService(IReservationService):
         Returns:
             Iterable[Reservation] | None: The collection of the reservations if exists.
         """
-        return await self._repository.get_all_reservations_by_equipment_id(equipment_id)
+        return await self._equipment_loader.load(equipment_id)
 
     async def get_all_reservation_by_category_id(
         self, category_id: int
@@ -79,7 +108,7 @@ class ReservationService(IReservationService):
         Returns:
             Iterable[Reservation] | None: The collection of the reservations if exists.
         """
-        return await self._repository.get_all_reservations_by_category_id(category_id)
+        return await self._category_loader.load(category_id)
 
     async def get_all_reservation_by_subcategory_id(
         self, subcategory_id: int
@@ -92,9 +121,7 @@ class ReservationService(IReservationService):
         Returns:
             Iterable[Reservation] | None: The collection of the reservations if exists.
         """
-        return await self._repository.get_all_reservations_by_subcategory_id(
-            subcategory_id
-        )
+        return await self._subcategory_loader.load(subcategory_id)
 
     async def add_reservation(self, data: ReservationIn) -> Reservation | None:
         """The method adding new reservation to the repository.
@@ -105,7 +132,26 @@ class ReservationService(IReservationService):
         Returns:
             Reservation | None: The newly created reservation.
         """
-        return await self._repository.add_reservation(data)
+        new_reservation = await self._repository.add_reservation(data)
+        self._invalidate(ranking_changed=data.status == _FINISHED)
+        return new_reservation
+
+    async def add_reservations_bulk(
+        self, data: list[ReservationIn]
+    ) -> Iterable[Reservation]:
+        """The method adding many reservations to the repository at once.
+
+        Args:
+            data (list[ReservationIn]): The attributes of the reservations.
+
+        Returns:
+            Iterable[Reservation]: The collection of the newly created reservations.
+        """
+        new_reservations = await self._repository.add_reservations_bulk(data)
+        self._invalidate(
+            ranking_changed=any(reservation.status == _FINISHED for reservation in data)
+        )
+        return new_reservations
 
     async def update_reservation(
         self, reservation_id: int, data: ReservationIn
@@ -119,9 +165,11 @@ class ReservationService(IReservationService):
         Returns:
             Reservation | None: The updated reservation.
         """
-        return await self._repository.update_reservation(
+        updated_reservation = await self._repository.update_reservation(
             reservation_id=reservation_id, data=data
         )
+        self._invalidate(ranking_changed=True)
+        return updated_reservation
 
     async def delete_reservation(self, reservation_id: int) -> bool:
         """The method deleting reservation from the repository.
@@ -132,32 +180,60 @@ class ReservationService(IReservationService):
         Returns:
             bool: The success of the operation.
         """
-        return await self._repository.delete_reservation(reservation_id)
+        is_deleted = await self._repository.delete_reservation(reservation_id)
+        self._invalidate(ranking_changed=True)
+        return is_deleted
 
-    async def get_most_rented_equipment_ids(self, limit: int) -> Iterable[dict]:
+    async def get_most_rented_equipment_ids(
+        self, limit: int
+    ) -> tuple[list[int], list[int]]:
         """The method getting most rented equipment IDs from the repository.
 
+        The result is cached per limit and dropped whenever a finished
+        reservation is added, or any reservation is updated or deleted.
+
         Args:
             limit (int): The limit of the most rented equipment IDs.
 
         Returns:
-            Iterable[dict]: The collection of the most rented equipment IDs.
+            tuple[list[int], list[int]]: The equipment IDs and their rent counts.
         """
-        return await self._repository.get_most_rented_equipment_ids(limit)
+        return await self._cache.get_or_load(
+            f"{MOST_RENTED_KEY_PREFIX}{limit}",
+            lambda: self._repository.get_most_rented_equipment_ids(limit),
+            ttl=MOST_RENTED_CACHE_TTL,
+        )
+
+    async def get_user_dashboard(
+        self, user_id: UUID, limit: int
+    ) -> ReservationDashboard:
+        """The method getting user's reservations with most rented equipment.
 
-    async def calculate_total_price(
-        self, equipment_id: int, start_date: date, end_date: date
-    ) -> float:
-        """The method calculating total price of the reservation.
+        Both lookups are independent queries, so they are issued concurrently.
 
         Args:
-            equipment_id (int): The id of the equipment.
-            start_date (date): The start date of the reservation.
-            end_date (date): The end date of the reservation.
+            user_id (UUID): The id of the user.
+            limit (int): The limit of the most rented equipment IDs.
 
         Returns:
-            float: The total price of the reservation.
+            ReservationDashboard: The user's reservations and most rented equipment.
         """
-        return await self._repository.calculate_total_price(
-            equipment_id, start_date, end_date
+        reservations, (ids, counts) = await asyncio.gather(
+            self._user_loader.load(user_id),
+            self.get_most_rented_equipment_ids(limit),
+        )
+        return ReservationDashboard(
+            reservations=list(reservations),
+            most_rented=MostRentedEquipment(ids=ids, counts=counts),
         )
+
+    def _invalidate(self, ranking_changed: bool) -> None:
+        """A private method dropping cached data affected by a reservation change.
+
+        Args:
+            ranking_changed (bool): Whether a finished reservation changed,
+                which affects the most rented equipment ranking.
+        """
+        self._cache.delete(ALL_RESERVATIONS_RESPONSE_KEY)
+        if ranking_changed:
+            self._cache.delete_prefix(MOST_RENTED_KEY_PREFIX)
@@ -5,20 +5,37 @@ from typing import Iterable
 from src.core.domain.subcategory import Subcategory, SubcategoryIn
 from src.core.repositories.isubcategory import ISubcategoryRepository
 from src.infrastructure.services.isubcategory import ISubcategoryService
+from src.infrastructure.utils.cache import TTLCache
+from src.infrastructure.utils.consts import (
+    ALL_SUBCATEGORIES_RESPONSE_KEY,
+    SUBCATEGORY_RESPONSE_KEY_PREFIX,
+    SUBCATEGORY_TREE_CACHE_TTL,
+    SUBCATEGORY_TREE_KEY,
+)
 
 
 class SubcategoryService(ISubcategoryService):
-    """A class implementing the subcategory service."""
+    """A class implementing the subcategory service.
+
+    All subcategories are kept in the shared cache, both in name order and
+    grouped by category, so listings are served from memory until
+    a subcategory changes.
+    """
+
+    __slots__ = ("_repository", "_cache")
 
     _repository: ISubcategoryRepository
+    _cache: TTLCache
 
-    def __init__(self, repository: ISubcategoryRepository) -> None:
+    def __init__(self, repository: ISubcategoryRepository, cache: TTLCache) -> None:
         """The initializer of the subcategory service.
 
         Args:
             repository (ISubcategoryRepository): The reference to the repository.
+            cache (TTLCache): The reference to the shared cache.
         """
         self._repository = repository
+        self._cache = cache
 
     async def get_subcategory_by_id(self, subcategory_id: int) -> Subcategory | None:
         """The method getting a subcategory from the repository.
@@ -37,7 +54,8 @@ class SubcategoryService(ISubcategoryService):
         Returns:
             Iterable[Subcategory]: The collection of the all subcategories.
         """
-        return await self._repository.get_all_subcategories()
+        subcategories, _ = await self._get_subcategories()
+        return subcategories
 
     async def get_all_subcategories_by_category_id(
         self, category_id: int
@@ -50,7 +68,8 @@ class SubcategoryService(ISubcategoryService):
         Returns:
             Iterable[Subcategory]: The collection of the all subcategories.
         """
-        return await self._repository.get_all_subcategories_by_category_id(category_id)
+        _, subcategories_by_category = await self._get_subcategories()
+        return subcategories_by_category.get(category_id, [])
 
     async def add_subcategory(self, data: SubcategoryIn) -> Subcategory | None:
         """The method adding new subcategory to the repository.
@@ -61,7 +80,9 @@ class SubcategoryService(ISubcategoryService):
         Returns:
             Subcategory | None: The newly created subcategory.
         """
-        return await self._repository.add_subcategory(data)
+        new_subcategory = await self._repository.add_subcategory(data)
+        self._invalidate()
+        return new_subcategory
 
     async def update_subcategory(
         self, subcategory_id: int, data: SubcategoryIn
@@ -75,9 +96,11 @@ class SubcategoryService(ISubcategoryService):
         Returns:
             Subcategory | None: The updated subcategory.
         """
-        return await self._repository.update_subcategory(
+        updated_subcategory = await self._repository.update_subcategory(
             subcategory_id=subcategory_id, data=data
         )
+        self._invalidate()
+        return updated_subcategory
 
     async def delete_subcategory(self, subcategory_id: int) -> bool:
         """The method deleting subcategory from the repository.
@@ -88,4 +111,44 @@ class SubcategoryService(ISubcategoryService):
         Returns:
             bool: The success of the operation.
         """
-        return await self._repository.delete_subcategory(subcategory_id)
+        is_deleted = await self._repository.delete_subcategory(subcategory_id)
+        self._invalidate()
+        return is_deleted
+
+    async def _get_subcategories(
+        self,
+    ) -> tuple[list[Subcategory], dict[int, list[Subcategory]]]:
+        """A private method getting all subcategories from the cache.
+
+        Returns:
+            tuple[list[Subcategory], dict[int, list[Subcategory]]]: The
+                subcategories ordered by name and grouped by category id.
+        """
+        return await self._cache.get_or_load(
+            SUBCATEGORY_TREE_KEY,
+            self._load_subcategories,
+            ttl=SUBCATEGORY_TREE_CACHE_TTL,
+        )
+
+    async def _load_subcategories(
+        self,
+    ) -> tuple[list[Subcategory], dict[int, list[Subcategory]]]:
+        """A private method loading all subcategories from the repository.
+
+        Returns:
+            tuple[list[Subcategory], dict[int, list[Subcategory]]]: The
+                subcategories ordered by name and grouped by category id.
+        """
+        subcategories = list(await self._repository.get_all_subcategories())
+        subcategories_by_category: dict[int, list[Subcategory]] = {}
+        for subcategory in subcategories:
+            subcategories_by_category.setdefault(subcategory.category_id, []).append(
+                subcategory
+            )
+        return subcategories, subcategories_by_category
+
+    def _invalidate(self) -> None:
+        """A private method dropping the cached subcategories."""
+        self._cache.delete(SUBCATEGORY_TREE_KEY)
+        self._cache.delete(ALL_SUBCATEGORIES_RESPONSE_KEY)
+        self._cache.delete_prefix(SUBCATEGORY_RESPONSE_KEY_PREFIX)
@@ -1,8 +1,8 @@
 """A module containing user service."""
 
-from typing import Iterable
-
-from pydantic import UUID4
+import asyncio
+from typing import AsyncIterator
+from uuid import UUID
 
 from src.core.domain.user import User, UserIn
 from src.core.repositories.iuser import IUserRepository
@@ -44,7 +44,9 @@ class UserService(IUserService):
         """
 
         if user_data := await self._repository.get_by_email(user.email):
-            if verify_password(user.password, user_data.password):
+            if await asyncio.to_thread(
+                verify_password, user.password, user_data.password
+            ):
                 token_details = generate_user_token(user_data.id)
                 # trunk-ignore(bandit/B106)
                 return TokenDTO(token_type="Bearer", **token_details)
@@ -53,11 +55,11 @@ class UserService(IUserService):
 
         return None
 
-    async def get_user_by_uuid(self, uuid: UUID4) -> UserDTO | None:
+    async def get_user_by_uuid(self, uuid: UUID) -> UserDTO | None:
         """A method getting user by UUID.
 
         Args:
-            uuid (UUID4): The UUID of the user.
+            uuid (UUID): The UUID of the user.
 
         Returns:
             UserDTO | None: The user data, if found.
@@ -77,10 +79,10 @@ class UserService(IUserService):
 
         return await self._repository.get_by_email(email)
 
-    async def get_all_users(self) -> Iterable[User]:
-        """The method getting all registered users.
-        
+    def get_all_users(self) -> AsyncIterator[User]:
+        """The method streaming all registered users.
+
         Returns:
-            Iterable[User]: The collection of all registered users
+            AsyncIterator[User]: The all registered users.
         """
-        return await self._repository.get_all_users()
+        return self._repository.get_all_users()
@@ -1,82 +1,157 @@
 """Module containing user review service implementation."""
 
-from typing import Iterable
-
-from pydantic import UUID4
+from typing import AsyncIterator, Iterable
+from uuid import UUID
 
 from src.core.domain.user_review import UserReview, UserReviewIn
 from src.core.repositories.iuser_review import IUserReviewRepository
 from src.infrastructure.services.iuser_review import IUserReviewService
+from src.infrastructure.utils.cache import TTLCache
+from src.infrastructure.utils.consts import (
+    USER_RATING_CACHE_TTL,
+    USER_RATING_KEY_PREFIX,
+    USER_REVIEW_CACHE_TTL,
+    USER_REVIEW_KEY_PREFIX,
+)
+from src.infrastructure.utils.dataloader import DataLoader
+
+
+def _average_rating_key(user_id: UUID | None) -> str:
+    """A function returning cache key of the user's average rating.
+
+    Args:
+        user_id (UUID | None): The user id.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"{USER_RATING_KEY_PREFIX}{user_id}"
 
 
 class UserReviewService(IUserReviewService):
-    """A class implementing the user review service."""
+    """A class implementing the user review service.
+
+    Its loaders batch lookups across concurrent requests.
+    """
+
+    __slots__ = (
+        "_repository",
+        "_cache",
+        "_sent_loader",
+        "_received_loader",
+        "_average_loader",
+    )
 
     _repository: IUserReviewRepository
+    _cache: TTLCache
+    _sent_loader: DataLoader[UUID, list[UserReview]]
+    _received_loader: DataLoader[UUID, list[UserReview]]
+    _average_loader: DataLoader[UUID, float | None]
 
-    def __init__(self, repository: IUserReviewRepository) -> None:
+    def __init__(self, repository: IUserReviewRepository, cache: TTLCache) -> None:
         """The initializer of the user review service.
 
         Args:
             repository (IUserReviewRepository): The reference to the repository.
+            cache (TTLCache): The reference to the shared cache.
         """
         self._repository = repository
+        self._cache = cache
+        self._sent_loader = DataLoader(repository.get_sent_reviews_for_user_ids, list)
+        self._received_loader = DataLoader(
+            repository.get_received_reviews_for_user_ids, list
+        )
+        self._average_loader = DataLoader(
+            repository.get_average_ratings_for_users, lambda: None
+        )
 
     async def get_user_review_by_id(self, user_review_id: int) -> UserReview | None:
         """The method getting an user review from the repository.
 
+        The review is cached by id and dropped when it is deleted.
+
         Args:
             user_review_id (int): The id of the user review.
 
         Returns:
             UserReview | None: The user review data if exists.
         """
-        return await self._repository.get_user_review_by_id(user_review_id)
+        return await self._cache.get_or_load(
+            f"{USER_REVIEW_KEY_PREFIX}{user_review_id}",
+            lambda: self._repository.get_user_review_by_id(user_review_id),
+            ttl=USER_REVIEW_CACHE_TTL,
+        )
 
-    async def get_all_user_reviews(self) -> Iterable[UserReview]:
-        """The method getting all user reviews from the repository.
+    def get_all_user_reviews(self) -> AsyncIterator[UserReview]:
+        """The method streaming all user reviews from the repository.
 
         Returns:
-            Iterable[UserReview]: The collection of all user reviews.
+            AsyncIterator[UserReview]: The all user reviews.
         """
-        return await self._repository.get_all_user_reviews()
+        return self._repository.get_all_user_reviews()
 
     async def get_sent_reviews_for_user_id(
-        self, user_id: UUID4
+        self, user_id: UUID
     ) -> Iterable[UserReview]:
         """The method getting all user reviews sent by provided user id from the repository.
 
         Args:
-            user_id (UUID4): The user id.
+            user_id (UUID): The user id.
 
         Returns:
             Iterable[UserReview]: The collection of all user reviews sent by provided user.
         """
-        return await self._repository.get_sent_reviews_for_user_id(user_id)
+        return await self._sent_loader.load(user_id)
 
     async def get_received_reviews_for_user_id(
-        self, reviewer_id: UUID4
+        self, reviewer_id: UUID
     ) -> Iterable[UserReview]:
         """The method getting all user reviews received by provided user id from the repository.
 
         Args:
-            reviewer_id (UUID4): The reviewer id.
+            reviewer_id (UUID): The reviewer id.
 
         Returns:
             Iterable[UserReview]: The collection of all user reviews received by provided user.
         """
-        return await self._repository.get_received_reviews_for_user_id(reviewer_id)
+        return await self._received_loader.load(reviewer_id)
+
+    async def get_received_reviews_page(
+        self, user_id: UUID, before_id: int | None, limit: int
+    ) -> Iterable[UserReview]:
+        """The method getting a page of user reviews received by the user.
+
+        Args:
+            user_id (UUID): The user id.
+            before_id (int | None): The id of the last review of the previous
+                page, None for the first page.
+            limit (int): The maximum number of reviews in the page.
+
+        Returns:
+            Iterable[UserReview]: The user reviews, newest first.
+        """
+        return await self._repository.get_received_reviews_page(
+            user_id, before_id, limit
+        )
 
-    async def get_average_rating_for_user(self, user_id: UUID4) -> float | None:
+    async def get_average_rating_for_user(self, user_id: UUID) -> float | None:
         """The method getting average rating for user from the repository.
 
+        The rating is cached per user and dropped whenever a review of
+        the user is added or deleted. Misses of concurrent lookups are
+        fetched together with one query.
+
         Args:
-            user_id (UUID4): The user id.
+            user_id (UUID): The user id.
 
         Returns:
             float | None: The average rating for user.
         """
-        return await self._repository.get_average_rating_for_user(user_id)
+        return await self._cache.get_or_load(
+            _average_rating_key(user_id),
+            lambda: self._average_loader.load(user_id),
+            ttl=USER_RATING_CACHE_TTL,
+        )
 
     async def add_user_review(self, data: UserReviewIn) -> UserReview | None:
         """The method adding new user review to the repository.
@@ -87,7 +162,29 @@ class UserReviewService(IUserReviewService):
         Returns:
             UserReview | None: The newly created user review.
         """
-        return await self._repository.add_user_review(data)
+        new_review = await self._repository.add_user_review(data)
+        if new_review:
+            self._cache.delete(f"{USER_REVIEW_KEY_PREFIX}{new_review.id}")
+        self._cache.delete(_average_rating_key(data.reviewed_user_id))
+        return new_review
+
+    async def add_user_reviews_bulk(
+        self, data: list[UserReviewIn]
+    ) -> Iterable[UserReview]:
+        """The method adding many user reviews to the repository at once.
+
+        Args:
+            data (list[UserReviewIn]): The attributes of the user reviews.
+
+        Returns:
+            Iterable[UserReview]: The collection of the newly created user reviews.
+        """
+        new_reviews = await self._repository.add_user_reviews_bulk(data)
+        for new_review in new_reviews:
+            self._cache.delete(f"{USER_REVIEW_KEY_PREFIX}{new_review.id}")
+        for reviewed_user_id in {review.reviewed_user_id for review in data}:
+            self._cache.delete(_average_rating_key(reviewed_user_id))
+        return new_reviews
 
     async def delete_user_review(self, user_review_id: int) -> bool:
         """The method deleting user review from the repository.
@@ -98,4 +195,11 @@ class UserReviewService(IUserReviewService):
         Returns:
             bool: The success of the operation.
         """
-        return await self._repository.delete_user_review(user_review_id)
+        review = await self._repository.get_user_review_by_id(user_review_id)
+        if not review:
+            return False
+
+        is_deleted = await self._repository.delete_user_review(user_review_id)
+        self._cache.delete(f"{USER_REVIEW_KEY_PREFIX}{user_review_id}")
+        self._cache.delete(_average_rating_key(review.reviewed_user_id))
+        return is_deleted
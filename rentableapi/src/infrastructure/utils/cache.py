@@ -0,0 +1,178 @@
+"""A module containing an in-process cache with expiring entries."""
+
+import asyncio
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """A class implementing a bounded in-process cache with expiring entries."""
+
+    _maxsize: int
+    _ttl: float
+    _entries: dict[str, tuple[Any, float]]
+    _loading: dict[str, asyncio.Future]
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0) -> None:
+        """The initializer of the cache.
+
+        Args:
+            maxsize (int, optional): The maximum number of entries.
+                Defaults to 1024.
+            ttl (float, optional): The default lifetime of an entry in seconds.
+                Defaults to 60.0.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries = {}
+        self._loading = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """The method getting a value from the cache.
+
+        Args:
+            key (str): The key of the entry.
+            default (Any, optional): The value returned on a miss.
+                Defaults to None.
+
+        Returns:
+            Any: The cached value if exists and not expired, the default otherwise.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return default
+
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """The method storing a value in the cache.
+
+        Args:
+            key (str): The key of the entry.
+            value (Any): The value to be stored.
+            ttl (float | None, optional): The lifetime of the entry in seconds.
+                Defaults to the cache-wide lifetime.
+        """
+        if key not in self._entries and len(self._entries) >= self._maxsize:
+            self._evict()
+
+        expires_at = time.monotonic() + (self._ttl if ttl is None else ttl)
+        self._entries[key] = (value, expires_at)
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: float | None = None,
+    ) -> Any:
+        """The method getting a value from the cache, loading it on a miss.
+
+        Concurrent misses of the same key share a single load. An entry
+        invalidated while it is being loaded is not stored.
+
+        Args:
+            key (str): The key of the entry.
+            loader (Callable[[], Awaitable[Any]]): The coroutine function
+                loading the value when it is not cached.
+            ttl (float | None, optional): The lifetime of the loaded entry
+                in seconds. Defaults to the cache-wide lifetime.
+
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+        if (value := self.get(key, _MISSING)) is not _MISSING:
+            return value
+
+        if (load := self._loading.get(key)) is None:
+            load = asyncio.ensure_future(loader())
+            self._loading[key] = load
+            load.add_done_callback(partial(self._store_loaded, key, ttl))
+
+        return await asyncio.shield(load)
+
+    def begin_load(self, key: str, ttl: float | None = None) -> asyncio.Future | None:
+        """The method registering a load of the key done outside `get_or_load`.
+
+        The value set as the result of the returned future is stored like
+        the one of `get_or_load`, unless the key is invalidated meanwhile.
+        Cancelling the future stores nothing.
+
+        Args:
+            key (str): The key of the entry.
+            ttl (float | None, optional): The lifetime of the loaded entry
+                in seconds. Defaults to the cache-wide lifetime.
+
+        Returns:
+            asyncio.Future | None: The future to be resolved with the value,
+                None if the key is already being loaded.
+        """
+        if key in self._loading:
+            return None
+
+        load = asyncio.get_running_loop().create_future()
+        self._loading[key] = load
+        load.add_done_callback(partial(self._store_loaded, key, ttl))
+        return load
+
+    def delete(self, key: str) -> None:
+        """The method removing an entry from the cache.
+
+        Args:
+            key (str): The key of the entry.
+        """
+        self._entries.pop(key, None)
+        self._loading.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """The method removing all entries with keys starting with the prefix.
+
+        Args:
+            prefix (str): The prefix of the keys.
+        """
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+        for key in [key for key in self._loading if key.startswith(prefix)]:
+            del self._loading[key]
+
+    def clear(self) -> None:
+        """The method removing all entries from the cache."""
+        self._entries.clear()
+        self._loading.clear()
+
+    def _store_loaded(self, key: str, ttl: float | None, load: asyncio.Future) -> None:
+        """A private method storing the result of a finished load.
+
+        Args:
+            key (str): The key of the entry.
+            ttl (float | None): The lifetime of the entry in seconds.
+            load (asyncio.Future): The finished load.
+        """
+        if self._loading.get(key) is not load:
+            return
+
+        del self._loading[key]
+        if not load.cancelled() and load.exception() is None:
+            self.set(key, load.result(), ttl=ttl)
+
+    def _evict(self) -> None:
+        """A private method making room for a new entry.
+
+        Expired entries are dropped first; if the cache is still full,
+        the oldest inserted entry is removed.
+        """
+        now = time.monotonic()
+        for key in [
+            key for key, (_, expires_at) in self._entries.items() if expires_at <= now
+        ]:
+            del self._entries[key]
+
+        if len(self._entries) >= self._maxsize:
+            del self._entries[next(iter(self._entries))]
@@ -0,0 +1,178 @@
+"""A module containing the listener of database cache invalidation events."""
+
+import asyncio
+import json
+import logging
+from typing import Any
+
+import asyncpg  # type: ignore
+
+from src.config import config
+from src.db import CACHE_INVALIDATION_CHANNEL, direct_db_host
+from src.infrastructure.utils.cache import TTLCache
+from src.infrastructure.utils.consts import (
+    ALL_CATEGORIES_RESPONSE_KEY,
+    ALL_EQUIPMENT_RESPONSE_KEY,
+    ALL_EQUIPMENT_REVIEWS_RESPONSE_KEY,
+    ALL_RESERVATIONS_RESPONSE_KEY,
+    ALL_SUBCATEGORIES_RESPONSE_KEY,
+    EQUIPMENT_RATING_KEY_PREFIX,
+    EQUIPMENT_RESPONSE_KEY_PREFIX,
+    MOST_RENTED_KEY_PREFIX,
+    SUBCATEGORY_RESPONSE_KEY_PREFIX,
+    SUBCATEGORY_TREE_KEY,
+    USER_RATING_KEY_PREFIX,
+    USER_REVIEW_KEY_PREFIX,
+)
+
+logger = logging.getLogger(__name__)
+
+_RECONNECT_MIN_DELAY = 0.5
+_RECONNECT_MAX_DELAY = 30.0
+
+
+def invalidate(cache: TTLCache, event: dict[str, Any]) -> None:
+    """A function dropping cache entries affected by a database change.
+
+    Args:
+        cache (TTLCache): The cache to be invalidated.
+        event (dict[str, Any]): The change event sent by the database.
+    """
+    match event.get("table"):
+        case "categories":
+            cache.delete(ALL_CATEGORIES_RESPONSE_KEY)
+        case "subcategories":
+            cache.delete(ALL_SUBCATEGORIES_RESPONSE_KEY)
+            cache.delete(SUBCATEGORY_TREE_KEY)
+            cache.delete_prefix(SUBCATEGORY_RESPONSE_KEY_PREFIX)
+        case "equipment":
+            cache.delete(ALL_EQUIPMENT_RESPONSE_KEY)
+            cache.delete(f"{EQUIPMENT_RESPONSE_KEY_PREFIX}{event.get('id')}")
+        case "reservations":
+            cache.delete(ALL_RESERVATIONS_RESPONSE_KEY)
+            if event.get("op") == "UPDATE" or event.get("status") == "finished":
+                cache.delete_prefix(MOST_RENTED_KEY_PREFIX)
+        case "equipment_reviews":
+            cache.delete(ALL_EQUIPMENT_REVIEWS_RESPONSE_KEY)
+            cache.delete(f"{EQUIPMENT_RATING_KEY_PREFIX}{event.get('equipment_id')}")
+        case "user_reviews":
+            cache.delete(f"{USER_REVIEW_KEY_PREFIX}{event.get('id')}")
+            cache.delete(f"{USER_RATING_KEY_PREFIX}{event.get('reviewed_user_id')}")
+
+
+class CacheInvalidationListener:
+    """A class listening for database change events on a dedicated connection.
+
+    When the connection is lost, it is reopened with a growing delay and
+    the whole cache is cleared, as the notifications sent meanwhile are
+    lost.
+    """
+
+    _cache: TTLCache
+    _connection: asyncpg.Connection | None
+    _reconnect_task: asyncio.Task | None
+    _stopped: bool
+
+    def __init__(self, cache: TTLCache) -> None:
+        """The initializer of the listener.
+
+        Args:
+            cache (TTLCache): The reference to the shared cache.
+        """
+        self._cache = cache
+        self._connection = None
+        self._reconnect_task = None
+        self._stopped = True
+
+    async def start(self) -> None:
+        """The method opening the connection and subscribing to the channel."""
+        self._stopped = False
+        await self._connect()
+
+    async def stop(self) -> None:
+        """The method closing the listening connection."""
+        self._stopped = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await connection.close()
+
+    async def _connect(self) -> None:
+        """A private method opening the connection and subscribing to the channel.
+
+        The connection bypasses any transaction pooler, as LISTEN needs
+        a session that stays on one server backend.
+        """
+        connection = await asyncpg.connect(
+            host=direct_db_host,
+            port=config.DB_DIRECT_PORT,
+            user=config.DB_USER,
+            password=config.DB_PASSWORD,
+            database=config.DB_NAME,
+        )
+        connection.add_termination_listener(self._on_termination)
+        await connection.add_listener(CACHE_INVALIDATION_CHANNEL, self._on_notification)
+        self._connection = connection
+
+    async def _reconnect(self) -> None:
+        """A private method reopening the connection until it succeeds."""
+        delay = _RECONNECT_MIN_DELAY
+        while not self._stopped:
+            try:
+                await self._connect()
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as error:
+                logger.warning(
+                    "Cache invalidation listener reconnect failed: %s", error
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RECONNECT_MAX_DELAY)
+            else:
+                self._cache.clear()
+                logger.info("Cache invalidation listener reconnected")
+                return
+
+    def _on_termination(self, connection: asyncpg.Connection) -> None:
+        """A private method scheduling a reconnect after the connection is lost.
+
+        Args:
+            connection (asyncpg.Connection): The terminated connection.
+        """
+        if self._stopped or connection is not self._connection:
+            return
+
+        logger.warning("Cache invalidation listener lost its connection")
+        self._connection = None
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+        self._reconnect_task.add_done_callback(self._on_reconnect_done)
+
+    def _on_reconnect_done(self, task: asyncio.Task) -> None:
+        """A private method releasing the finished reconnect task.
+
+        Args:
+            task (asyncio.Task): The finished reconnect task.
+        """
+        if self._reconnect_task is task:
+            self._reconnect_task = None
+
+    def _on_notification(
+        self,
+        _connection: asyncpg.Connection,
+        _pid: int,
+        _channel: str,
+        payload: str,
+    ) -> None:
+        """A private method handling a single change notification.
+
+        Args:
+            _connection (asyncpg.Connection): The listening connection.
+            _pid (int): The id of the notifying backend process.
+            _channel (str): The name of the channel.
+            payload (str): The JSON encoded change event.
+        """
+        try:
+            invalidate(self._cache, json.loads(payload))
+        except (TypeError, ValueError):
+            logger.warning("Malformed cache invalidation payload: %s", payload)
@@ -3,3 +3,27 @@
 EXPIRATION_MINUTES = 60
 SECRET_KEY = "s3cr3t"  # TODO: -> random generation - it's safe
 ALGORITHM = "HS256"
+
+EQUIPMENT_RATING_CACHE_TTL = 3600
+EQUIPMENT_RATING_KEY_PREFIX = "eq_review:avg:"
+USER_RATING_CACHE_TTL = 60
+USER_RATING_KEY_PREFIX = "user_review:avg:"
+USER_REVIEW_CACHE_TTL = 300
+USER_REVIEW_KEY_PREFIX = "user_review:id:"
+USER_REVIEWS_PAGE_SIZE = 50
+USER_REVIEWS_MAX_PAGE_SIZE = 100
+USER_REVIEWS_MAX_BULK_SIZE = 1000
+EQUIPMENT_MAX_BATCH_IDS = 100
+MOST_RENTED_CACHE_TTL = 600
+SUBCATEGORY_TREE_CACHE_TTL = 3600
+SUBCATEGORY_TREE_KEY = "subcategory:by_category"
+MOST_RENTED_KEY_PREFIX = "resv:most_rented:"
+
+RESPONSE_CACHE_TTL = 300
+ALL_CATEGORIES_RESPONSE_KEY = "resp:category:all"
+ALL_SUBCATEGORIES_RESPONSE_KEY = "resp:subcategory:all"
+SUBCATEGORY_RESPONSE_KEY_PREFIX = "resp:subcategory:id:"
+ALL_EQUIPMENT_RESPONSE_KEY = "resp:equipment:all"
+EQUIPMENT_RESPONSE_KEY_PREFIX = "resp:equipment:id:"
+ALL_RESERVATIONS_RESPONSE_KEY = "resp:reservation:all"
+ALL_EQUIPMENT_REVIEWS_RESPONSE_KEY = "resp:equipment_review:all"
@@ -0,0 +1,84 @@
+"""A module containing a loader coalescing lookups into batched queries."""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Mapping, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """A class batching lookups requested within the same event loop tick.
+
+    Keys requested before the batch is dispatched share a single call of
+    the batch function. Results are not kept after the batch resolves, so
+    the loader never serves stale data.
+    """
+
+    _batch_load_fn: Callable[[list[K]], Awaitable[Mapping[K, V]]]
+    _default_factory: Callable[[], V]
+    _pending: dict[K, asyncio.Future]
+    _tasks: set[asyncio.Task]
+
+    def __init__(
+        self,
+        batch_load_fn: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        default_factory: Callable[[], V],
+    ) -> None:
+        """The initializer of the loader.
+
+        Args:
+            batch_load_fn (Callable[[list[K]], Awaitable[Mapping[K, V]]]): The
+                coroutine function loading values for many keys at once.
+            default_factory (Callable[[], V]): The factory of the value returned
+                for keys missing in the batch result.
+        """
+        self._batch_load_fn = batch_load_fn
+        self._default_factory = default_factory
+        self._pending = {}
+        self._tasks = set()
+
+    async def load(self, key: K) -> V:
+        """The method loading a value as a part of the next batch.
+
+        Args:
+            key (K): The key of the value.
+
+        Returns:
+            V: The loaded value.
+        """
+        if (future := self._pending.get(key)) is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = loop.create_future()
+            self._pending[key] = future
+
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """A private method starting resolution of the collected batch."""
+        batch, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._resolve(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: dict[K, asyncio.Future]) -> None:
+        """A private method loading the batch and resolving its futures.
+
+        Args:
+            batch (dict[K, asyncio.Future]): The futures by requested key.
+        """
+        try:
+            results = await self._batch_load_fn(list(batch))
+        except Exception as error:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(
+                    results[key] if key in results else self._default_factory()
+                )
@@ -0,0 +1,41 @@
+"""A module containing a descriptor forwarding service methods to repositories."""
+
+from typing import Any
+
+
+class RepositoryDelegate:
+    """A descriptor exposing the same-named method of the owner's repository.
+
+    Accessing the attribute on a service instance returns the bound method
+    of `instance._repository` itself, so a pure pass-through method costs
+    no extra frame nor `await` on each call.
+    """
+
+    __slots__ = ("_name",)
+
+    _name: str
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """The method storing the name of the delegated method.
+
+        Args:
+            owner (type): The class the descriptor is assigned in.
+            name (str): The attribute name of the descriptor.
+        """
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        """The method resolving the delegated repository method.
+
+        Args:
+            instance (Any): The service instance, None on class access.
+            owner (type | None, optional): The class of the service.
+                Defaults to None.
+
+        Returns:
+            Any: The bound repository method or the descriptor on class access.
+        """
+        if instance is None:
+            return self
+
+        return getattr(instance._repository, self._name)
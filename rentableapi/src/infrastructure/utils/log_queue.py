@@ -0,0 +1,88 @@
+"""A module moving log handlers off the event loop onto background threads."""
+
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+class _LocalQueueHandler(QueueHandler):
+    """A class enqueuing log records without formatting them first.
+
+    The queue never leaves the process, so records keep their arguments
+    for handlers with own formatters, e.g. the uvicorn access log.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """The method returning the record to be enqueued.
+
+        Args:
+            record (logging.LogRecord): The emitted record.
+
+        Returns:
+            logging.LogRecord: The unchanged record.
+        """
+        return record
+
+
+class QueueLogging:
+    """A class routing records of the given loggers through in-memory queues.
+
+    Logging calls made while serving a request only enqueue the record;
+    formatting and writing to the stream is done by listener threads.
+    """
+
+    _logger_names: tuple[str, ...]
+    _saved: dict[str, tuple[list[logging.Handler], bool]]
+    _listeners: list[QueueListener]
+
+    def __init__(self, *logger_names: str) -> None:
+        """The initializer of the queued logging.
+
+        Args:
+            *logger_names (str): The names of the loggers to be queued.
+        """
+        self._logger_names = logger_names
+        self._saved = {}
+        self._listeners = []
+
+    def start(self) -> None:
+        """The method replacing the handlers of the loggers with queues.
+
+        A logger without own handlers gets one writing to stderr.
+        """
+        for name in self._logger_names:
+            logger = logging.getLogger(name)
+            self._saved[name] = (logger.handlers[:], logger.propagate)
+            handlers = logger.handlers[:] or [_stream_handler()]
+            queue: SimpleQueue = SimpleQueue()
+            logger.handlers = [_LocalQueueHandler(queue)]
+            logger.propagate = False
+
+            listener = QueueListener(queue, *handlers, respect_handler_level=True)
+            listener.start()
+            self._listeners.append(listener)
+
+    def stop(self) -> None:
+        """The method flushing the queues and restoring the original handlers."""
+        for listener in self._listeners:
+            listener.stop()
+        self._listeners.clear()
+
+        for name, (handlers, propagate) in self._saved.items():
+            logger = logging.getLogger(name)
+            logger.handlers = handlers
+            logger.propagate = propagate
+        self._saved.clear()
+
+
+def _stream_handler() -> logging.Handler:
+    """A function creating the default handler writing to stderr.
+
+    Returns:
+        logging.Handler: The stream handler.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(_FORMAT))
+    return handler
@@ -0,0 +1,24 @@
+"""A module containing helpers aggregating review ratings."""
+
+from typing import Iterable
+
+import numpy as np
+
+
+def average_rating(ratings: Iterable[int]) -> float | None:
+    """A function computing the average of review ratings.
+
+    Ratings are within 0..10, so they are packed into an int8 array and
+    averaged with a single vectorized pass instead of a Python loop.
+
+    Args:
+        ratings (Iterable[int]): The ratings to be averaged.
+
+    Returns:
+        float | None: The average rating if there are any ratings.
+    """
+    values = np.fromiter(ratings, dtype=np.int8)
+    if not values.size:
+        return None
+
+    return float(values.sum(dtype=np.int64) / values.size)
@@ -1,10 +1,13 @@
 """Main module of the app."""
 
+import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exception_handlers import http_exception_handler
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api.routers.category import router as category_router
 from src.api.routers.equipment import router as equipment_router
@@ -13,8 +16,25 @@ from src.api.routers.reservation import router as reservation_router
 from src.api.routers.subcategory import router as subcategory_router
 from src.api.routers.user_review import router as user_review_router
 from src.api.routers.user import router as user_router
+from src.api.utils.etag import ETagMiddleware
+from src.config import config
 from src.container import Container
-from src.db import database, init_db
+from src.db import database, init_db, pool_stats
+from src.infrastructure.utils.log_queue import QueueLogging
+
+logger = logging.getLogger(__name__)
+logging.getLogger("src").setLevel(config.LOG_LEVEL)
+queue_logging = QueueLogging("src", "uvicorn.error", "uvicorn.access")
+
+_ROUTERS = (
+    (category_router, "/category"),
+    (subcategory_router, "/subcategory"),
+    (user_router, "/user"),
+    (equipment_router, "/equipment"),
+    (reservation_router, "/reservation"),
+    (equipment_review_router, "/equipment_review"),
+    (user_review_router, "/user_review"),
+)
 
 container = Container()
 container.wire(
@@ -33,20 +53,32 @@ container.wire(
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncGenerator:
     """Lifespan function working on app startup."""
-    await init_db()
+    queue_logging.start()
+    if config.DB_INIT_ON_STARTUP:
+        await init_db()
     await database.connect()
+    logger.info("Database pool ready: %s", pool_stats())
+    await container.cache_invalidation_listener().start()
+    await container.subcategory_service().get_all_subcategories()
     yield
+    await container.cache_invalidation_listener().stop()
     await database.disconnect()
+    queue_logging.stop()
 
 
-app = FastAPI(lifespan=lifespan)
-app.include_router(category_router, prefix="/category")
-app.include_router(subcategory_router, prefix="/subcategory")
-app.include_router(user_router, prefix="/user")
-app.include_router(equipment_router, prefix="/equipment")
-app.include_router(reservation_router, prefix="/reservation")
-app.include_router(equipment_review_router, prefix="/equipment_review")
-app.include_router(user_review_router, prefix="/user_review")
+# No route ends with a slash, so a trailing slash is answered with 404
+# instead of a redirect costing the client another round trip.
+app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    redirect_slashes=False,
+)
+# ETags are computed on the uncompressed body, so GZip is added last and
+# wraps the ETag middleware.
+app.add_middleware(ETagMiddleware)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+for router, prefix in _ROUTERS:
+    app.include_router(router, prefix=prefix)
 
 
 @app.exception_handler(HTTPException)
@@ -63,4 +95,11 @@ async def http_exception_handle_logging(
     Returns:
         Response: The HTTP response.
     """
+    logger.info(
+        "HTTP %s on %s %s: %s",
+        exception.status_code,
+        request.method,
+        request.url.path,
+        exception.detail,
+    )
     return await http_exception_handler(request, exception)